@@ -49,8 +49,8 @@ def _apply_initial_theme(app: QApplication):
 
     if os.path.isfile(session_path):
         try:
-            with open(session_path, 'r', encoding='utf-8') as f:
-                data = _json.load(f)
+            with open(session_path, 'rb') as f:
+                data = _json.loads(f.read())   # one read; bytes are auto-detected as UTF-8
             theme_name    = data.get('_theme', 'Dark')
             custom_colors = data.get('_custom_colors')
         except Exception:
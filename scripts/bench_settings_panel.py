@@ -0,0 +1,77 @@
+"""
+SettingsPanel profiling script.
+
+Constructs and destroys the settings panel repeatedly, applies every
+built-in preset and opens each settings tab, all under cProfile, then
+prints the hottest functions. Run from the project root:
+
+    python scripts/bench_settings_panel.py [iterations] [sort_key]
+
+Works headless with QT_QPA_PLATFORM=offscreen. Panels use a throw-away
+profiles directory, so the real profiles/session.json is never touched.
+"""
+
+import cProfile
+import os
+import pstats
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QThreadPool
+
+
+def _exercise(app, panel_cls, presets: tuple):
+    panel = panel_cls()
+    QThreadPool.globalInstance().waitForDone()   # async profile load
+    app.processEvents()
+    for name in presets:
+        panel.preset_combo.setCurrentIndex(panel.preset_combo.findText(name))
+        panel._on_preset_load()
+    for i in range(panel.tabs.count()):
+        panel.tabs.setCurrentIndex(i)            # lays out lazy tabs
+    panel.flush_settings()
+    panel._session_timer.stop()                  # no autosave after teardown
+    panel._session_pool.waitForDone()
+    panel.deleteLater()
+    app.processEvents()
+
+
+def _run(app, panel_cls, presets: tuple, iterations: int, sort_key: str):
+    _exercise(app, panel_cls, presets)   # warm-up (imports, caches)
+
+    prof = cProfile.Profile()
+    t0 = time.perf_counter()
+    prof.enable()
+    for _ in range(iterations):
+        _exercise(app, panel_cls, presets)
+    prof.disable()
+    dt = time.perf_counter() - t0
+
+    print(f"{iterations} iterations: {dt * 1000 / iterations:.2f} ms each (profiled)")
+    pstats.Stats(prof).strip_dirs().sort_stats(sort_key).print_stats(25)
+
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    sort_key   = sys.argv[2] if len(sys.argv) > 2 else 'cumulative'
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    import src.ui.settings_panel as settings_panel
+    from src.ui.settings_panel import SettingsPanel, _BUILTIN_DISPLAY_NAMES
+
+    profiles_dir = tempfile.mkdtemp(prefix='bench_profiles_')
+    settings_panel._PROFILES_DIR = profiles_dir   # read by SettingsPanel.__init__
+    try:
+        _run(app, SettingsPanel, _BUILTIN_DISPLAY_NAMES, iterations, sort_key)
+    finally:
+        shutil.rmtree(profiles_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
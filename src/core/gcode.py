@@ -6,6 +6,7 @@ Converts sliced layers into Marlin/Klipper compatible G-code.
 
 import math
 import io
+from types import MappingProxyType
 from typing import List, Optional, Dict, Any
 import numpy as np
 
@@ -51,7 +52,7 @@ class GCodeGenerator:
             Complete G-code as a string
         """
         if printer_profile is None:
-            printer_profile = _default_printer_profile()
+            printer_profile = _DEFAULT_PRINTER_PROFILE
 
         # Reset state
         self.e_total = 0.0
@@ -448,14 +449,19 @@ class GCodeGenerator:
 # Default profile
 # ---------------------------------------------------------------------------
 
+# Read-only and shared; generate() only reads it
+_DEFAULT_PRINTER_PROFILE = MappingProxyType({
+    'bed_size': (220, 220),
+    'nozzle_diameter': 0.4,
+    'filament_diameter': 1.75,
+    'start_gcode': 'G28\nG92 E0',
+    'end_gcode': 'M104 S0\nM140 S0\nG28 X0\nM84',
+})
+
+
 def _default_printer_profile() -> Dict[str, Any]:
-    return {
-        'bed_size': [220, 220],
-        'nozzle_diameter': 0.4,
-        'filament_diameter': 1.75,
-        'start_gcode': 'G28\nG92 E0',
-        'end_gcode': 'M104 S0\nM140 S0\nG28 X0\nM84',
-    }
+    """A fresh, mutable copy of the default profile."""
+    return dict(_DEFAULT_PRINTER_PROFILE)
 
 
 def load_printer_profiles(profiles_path: str) -> Dict[str, Any]:
@@ -0,0 +1,63 @@
+"""
+JSON file helpers shared by the UI (profiles, presets, session).
+
+orjson is used when installed, with the stdlib json module as fallback.
+Writes go to a temp file that is renamed over the target, so a crash
+mid-write never leaves a half-written file behind.
+"""
+
+import json
+import os
+
+try:
+    import orjson
+    json_loads = orjson.loads      # C parser, accepts bytes directly
+
+    def json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def read_json(path: str):
+    """Read and parse a JSON file in one binary read (orjson if available)."""
+    with open(path, 'rb') as f:
+        return json_loads(f.read())
+
+
+# Parsed files: {path: (mtime_ns, data)} – shared by every caller
+_JSON_CACHE = {}
+
+
+def read_json_cached(path: str):
+    """read_json, memoized on the file's mtime (an edit invalidates it)."""
+    mtime = os.stat(path).st_mtime_ns
+    hit = _JSON_CACHE.get(path)
+    if hit is not None and hit[0] == mtime:
+        return hit[1]
+    data = read_json(path)
+    _JSON_CACHE[path] = (mtime, data)
+    return data
+
+
+def write_json(path: str, data) -> None:
+    """Encode first (orjson if available), then one binary write."""
+    write_bytes(path, json_dumps(data))
+
+
+def write_bytes(path: str, payload: bytes) -> None:
+    """Write *payload* to ``path + '.tmp'`` and rename it over *path*."""
+    tmp = path + '.tmp'
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
@@ -34,7 +34,7 @@ from src.core.infill import get_infill_function, solid_infill
 # Settings dataclass
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class SliceSettings:
     # ---- Layer / extrusion ----
     layer_height: float = 0.2
@@ -111,7 +111,7 @@ class SliceSettings:
 # SlicedLayer
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class SlicedLayer:
     z: float
     layer_num: int
@@ -260,24 +260,20 @@ class MainWindow(QMainWindow):
         # ---- View mode toggle buttons ----
         toolbar.addWidget(QLabel(" View: "))
 
-        _btn_style = (
-            "QPushButton{padding:2px 8px;}"
-            "QPushButton:checked{background:#3a7bd5;color:white;border-radius:3px;}"
-        )
-
+        # Both buttons share the #viewBtn rule in the app stylesheet (themes.py)
         self._view_btn_model = QPushButton("3D Model")
         self._view_btn_model.setCheckable(True)
         self._view_btn_model.setChecked(True)
         self._view_btn_model.setToolTip("Show 3D mesh (opaque)")
         self._view_btn_model.setFixedHeight(26)
-        self._view_btn_model.setStyleSheet(_btn_style)
+        self._view_btn_model.setObjectName("viewBtn")
         toolbar.addWidget(self._view_btn_model)
 
         self._view_btn_layers = QPushButton("Layer Preview")
         self._view_btn_layers.setCheckable(True)
         self._view_btn_layers.setToolTip("Show layer paths + transparent mesh background")
         self._view_btn_layers.setFixedHeight(26)
-        self._view_btn_layers.setStyleSheet(_btn_style)
+        self._view_btn_layers.setObjectName("viewBtn")
         toolbar.addWidget(self._view_btn_layers)
 
         # Exclusive group (two buttons only)
@@ -500,6 +496,7 @@ class MainWindow(QMainWindow):
     # ------------------------------------------------------------------
 
     def _on_slice(self):
+        self.settings_panel.flush_settings()   # pending edits must reach _on_settings_changed first
         if not self._meshes:
             QMessageBox.warning(self, "No Model", "Please load a 3D model first.")
             return
@@ -613,6 +610,7 @@ class MainWindow(QMainWindow):
     # ------------------------------------------------------------------
 
     def _on_export_gcode(self):
+        self.settings_panel.flush_settings()   # may discard layers sliced with older settings
         if not self._sliced_layers:
             QMessageBox.warning(self, "No Layers", "Please slice the model first.")
             return
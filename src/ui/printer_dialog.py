@@ -5,7 +5,6 @@ Allows the user to add, edit, and delete printer profiles.
 Profiles are stored in profiles/printers.json.
 """
 
-import json
 import os
 
 from PyQt6.QtWidgets import (
@@ -16,9 +15,16 @@ from PyQt6.QtWidgets import (
     QMessageBox, QInputDialog, QWidget, QFrame,
     QScrollArea, QSizePolicy, QSplitter
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QSignalBlocker
 from PyQt6.QtGui import QFont
 
+from src.core.jsonio import write_json
+
+# Shared fonts – built once per process, not per dialog open
+_LIST_TITLE_FONT = QFont("Arial", 10, QFont.Weight.Bold)
+_FORM_TITLE_FONT = QFont("Arial", 11, QFont.Weight.Bold)
+_GCODE_FONT      = QFont("Courier New", 9)
+
 
 def _dspin(mn, mx, val, step=0.1, suffix="", decimals=2) -> QDoubleSpinBox:
     w = QDoubleSpinBox()
@@ -85,7 +91,7 @@ class PrinterSettingsDialog(QDialog):
         ll.setSpacing(6)
 
         lbl = QLabel("Printers")
-        lbl.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        lbl.setFont(_LIST_TITLE_FONT)
         ll.addWidget(lbl)
 
         self._list = QListWidget()
@@ -123,7 +129,7 @@ class PrinterSettingsDialog(QDialog):
 
         # Title
         self._title_lbl = QLabel("Select a printer to edit")
-        self._title_lbl.setFont(QFont("Arial", 11, QFont.Weight.Bold))
+        self._title_lbl.setFont(_FORM_TITLE_FONT)
         rl.addWidget(self._title_lbl)
 
         # Scroll area for form
@@ -205,7 +211,7 @@ class PrinterSettingsDialog(QDialog):
         gcode_vl = QVBoxLayout(gcode_gb)
         gcode_vl.setSpacing(4)
 
-        mono = QFont("Courier New", 9)
+        mono = _GCODE_FONT
 
         gcode_vl.addWidget(QLabel("Start G-code:"))
         self._start_gcode = QPlainTextEdit()
@@ -262,11 +268,9 @@ class PrinterSettingsDialog(QDialog):
     # ------------------------------------------------------------------
 
     def _populate_list(self):
-        self._list.blockSignals(True)
-        self._list.clear()
-        for name in self._profiles:
-            self._list.addItem(name)
-        self._list.blockSignals(False)
+        with QSignalBlocker(self._list):
+            self._list.clear()
+            self._list.addItems(list(self._profiles))
 
     def _on_printer_selected(self, name: str):
         if not name or name not in self._profiles:
@@ -338,9 +342,8 @@ class PrinterSettingsDialog(QDialog):
         self._populate_list()
         items = self._list.findItems(new_name, Qt.MatchFlag.MatchExactly)
         if items:
-            self._list.blockSignals(True)
-            self._list.setCurrentItem(items[0])
-            self._list.blockSignals(False)
+            with QSignalBlocker(self._list):
+                self._list.setCurrentItem(items[0])
         self._title_lbl.setText(f"Editing: {new_name}")
 
     def _on_add(self):
@@ -395,14 +398,13 @@ class PrinterSettingsDialog(QDialog):
         if self._current_name:
             self._on_apply()
 
-        # Write to printers.json
+        # Write to printers.json (atomic temp-file write, see src.core.jsonio)
         try:
             # Only write the fields that printers.json uses
             out = {}
             for name, p in self._profiles.items():
                 out[name] = {k: v for k, v in p.items()}
-            with open(self._profiles_path, 'w', encoding='utf-8') as f:
-                json.dump(out, f, indent=2, ensure_ascii=False)
+            write_json(self._profiles_path, out)
         except Exception as e:
             QMessageBox.warning(self, "Save Error",
                                 f"Could not write printers.json:\n{e}")
@@ -9,14 +9,18 @@ Tabs:
   Temp/Fan – temperatures + cooling fan
 
 Preset system:
-  Built-in presets live in profiles/presets/_builtin/
+  Built-in presets are the _BUILTIN_PRESETS literal at the bottom of this
+  module (compiled into the .pyc – no JSON parse at startup)
   User presets saved to profiles/presets/<name>.json
 """
 
-import json
 import os
 import sys
+import time
 import dataclasses
+from types import MappingProxyType
+from contextlib import contextmanager
+from functools import partial
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QFormLayout,
@@ -26,15 +30,25 @@ from PyQt6.QtWidgets import (
     QButtonGroup, QRadioButton, QInputDialog, QMessageBox,
     QTextEdit, QColorDialog, QFileDialog
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QTimer, QObject, QRunnable, QThreadPool, QSignalBlocker,
+    QCoreApplication
+)
 from PyQt6.QtGui import QFont, QColor
 
 from src.core.slicer import SliceSettings
+from src.core.jsonio import (
+    json_dumps, read_json, read_json_cached, write_bytes, write_json
+)
 from src.ui.printer_dialog import PrinterSettingsDialog
 try:
     from src.ui.themes import THEME_NAMES
 except ImportError:
-    THEME_NAMES = ["Dark", "Darker", "Ocean", "Solarized Dark", "Light", "High Contrast", "Custom"]
+    THEME_NAMES = ("Dark", "Darker", "Ocean", "Solarized Dark", "Light", "High Contrast", "Custom")
+
+# SliceSettings field names, introspected once instead of per save/export
+_SS_FIELDS = tuple(f.name for f in dataclasses.fields(SliceSettings))
+_SS_DEFAULTS = SliceSettings()   # read-only reference for _get_default_data
 
 
 MIT_LICENSE_TEXT = """\
@@ -61,21 +75,162 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-_DEFAULT_CUSTOM_COLORS = {
+# Read-only; each panel / import takes its own .copy()
+_DEFAULT_CUSTOM_COLORS = MappingProxyType({
     'background': '#1e1e1e',
     'text':       '#dcdcdc',
     'accent':     '#2a82da',
-}
+})
+
+# QFont is an implicitly shared value type — one instance serves every panel
+_SLICE_BTN_FONT = QFont("Arial", 13, QFont.Weight.Bold)
+
+# Pre-formatted slider value labels, indexed by the slider value
+_PCT_LABELS = tuple(f"{i} %" for i in range(101))
+_DEG_LABELS = tuple(f"{i}°" for i in range(91))
+
+# Path separators are not allowed in preset file names
+_NAME_SANITIZE = str.maketrans({'/': '_', '\\': '_'})
+
+# Upper bound (seconds) on how long continuous edits may postpone the autosave
+_SESSION_MAX_DELAY = 3.0
+
+# Settings import/export dialogs. The native Windows dialog loads shell
+# extensions (cloud sync, AV hooks) and can take seconds to open; setting
+# SLICER_FAST_DIALOGS=1 switches these JSON dialogs to Qt's own dialog.
+_FILE_DIALOG_OPTIONS = (QFileDialog.Option.DontUseNativeDialog
+                        if os.environ.get('SLICER_FAST_DIALOGS') == '1'
+                        else QFileDialog.Option(0))
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _scroll(inner: QWidget) -> QScrollArea:
-    """Wrap a widget in a scroll area."""
+def _find_profiles_dir() -> str:
+    # When running as a PyInstaller frozen exe, sys._MEIPASS is the
+    # extracted bundle root; data files live there.
+    if getattr(sys, 'frozen', False):
+        return os.path.join(sys._MEIPASS, 'profiles')
+    here = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(os.path.dirname(os.path.dirname(here)), 'profiles')
+
+
+# Constant for the lifetime of the process – resolved once at import.
+_PROFILES_DIR = _find_profiles_dir()
+
+
+def _settings_dict(s: SliceSettings) -> dict:
+    """Flat {field: value} dict – SliceSettings is all scalars, so this
+    skips the recursive deep copy done by dataclasses.asdict()."""
+    return {name: getattr(s, name) for name in _SS_FIELDS}
+
+
+def _load_profile_json(profiles_dir: str, filename: str, fallback: dict) -> dict:
+    # profiles/ ディレクトリがなければ作成（EXE 配布・初回起動時対策）
+    os.makedirs(profiles_dir, exist_ok=True)
+    path = os.path.join(profiles_dir, filename)
+    try:
+        return read_json_cached(path)
+    except FileNotFoundError:
+        # ファイルがなければデフォルト内容で新規作成
+        try:
+            write_json(path, {name: dict(p) for name, p in fallback.items()})
+            print(f"[Settings] Created default {filename}")
+        except Exception as e:
+            print(f"[Settings] Could not create {filename}: {e}")
+        return fallback
+    except Exception as e:
+        print(f"[Settings] Failed to load {filename}: {e}")
+        return fallback
+
+
+def _load_profiles(profiles_dir: str) -> tuple:
+    """(printers, materials) from profiles_dir, defaults for missing/bad files."""
+    return (_load_profile_json(profiles_dir, 'printers.json',  _DEFAULT_PRINTERS),
+            _load_profile_json(profiles_dir, 'materials.json', _DEFAULT_MATERIALS))
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _PrinterDefaults:
+    """A printer profile normalised to floats; None = key absent."""
+    nozzle_diameter:   float
+    filament_diameter: float
+    bed_size:          tuple
+    bed_temp_max:      int
+    max_print_speed:   float
+    print_speed:       float | None
+    layer_height:      float | None
+    retraction_dist:   float | None
+    retraction_speed:  float | None
+
+    @classmethod
+    def from_profile(cls, profile) -> '_PrinterDefaults':
+        def opt(key):
+            return float(profile[key]) if key in profile else None
+        bed = profile.get('bed_size', (220, 220))
+        return cls(
+            nozzle_diameter   = float(profile.get('nozzle_diameter',   0.4)),
+            filament_diameter = float(profile.get('filament_diameter', 1.75)),
+            bed_size          = (float(bed[0]), float(bed[1])),
+            bed_temp_max      = int(profile.get('bed_temp_max', 100)),
+            max_print_speed   = float(profile.get('max_print_speed', 300)),
+            print_speed       = opt('default_print_speed'),
+            layer_height      = opt('default_layer_height'),
+            retraction_dist   = opt('default_retraction_distance'),
+            retraction_speed  = opt('default_retraction_speed'),
+        )
+
+
+class _ProfileLoadSignals(QObject):
+    loaded = pyqtSignal(object, object)   # (printers, materials)
+
+
+class _ProfileLoader(QRunnable):
+    """Parses the printer/material profiles off the GUI thread."""
+
+    def __init__(self, profiles_dir: str, signals: _ProfileLoadSignals):
+        super().__init__()
+        self._profiles_dir = profiles_dir
+        self._signals      = signals
+
+    def run(self):
+        printers, materials = _load_profiles(self._profiles_dir)
+        try:
+            # Queued to the panel's thread (receiver lives on the GUI thread)
+            self._signals.loaded.emit(printers, materials)
+        except RuntimeError:
+            pass   # panel was destroyed before loading finished
+
+
+class _SessionWriteSignals(QObject):
+    failed = pyqtSignal(bytes, str)   # (blob, error message)
+
+
+class _SessionWriter(QRunnable):
+    """Writes an already-serialised session blob off the GUI thread."""
+
+    def __init__(self, path: str, blob: bytes, signals: _SessionWriteSignals):
+        super().__init__()
+        self._path    = path
+        self._blob    = blob
+        self._signals = signals
+
+    def run(self):
+        try:
+            write_bytes(self._path, self._blob)
+        except Exception as e:
+            try:
+                self._signals.failed.emit(self._blob, str(e))
+            except RuntimeError:
+                pass   # panel already destroyed
+
+
+def _scroll(inner: QWidget = None) -> QScrollArea:
+    """Wrap a widget in a scroll area (empty placeholder when inner is None)."""
     sa = QScrollArea()
-    sa.setWidget(inner)
+    if inner is not None:
+        sa.setWidget(inner)
     sa.setWidgetResizable(True)
     sa.setFrameShape(QFrame.Shape.NoFrame)
     sa.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
@@ -84,9 +239,7 @@ def _scroll(inner: QWidget) -> QScrollArea:
 
 def _group(title: str, layout_type=QFormLayout) -> tuple:
     """Return (QGroupBox, layout)."""
-    gb = QGroupBox(title)
-    gb.setStyleSheet("QGroupBox{font-weight:bold;margin-top:6px;}"
-                     "QGroupBox::title{subcontrol-origin:margin;left:6px;}")
+    gb = QGroupBox(title)   # bold title etc. via the app stylesheet (themes.py)
     lo = layout_type(gb)
     lo.setSpacing(5)
     lo.setContentsMargins(6, 14, 6, 6)
@@ -95,35 +248,180 @@ def _group(title: str, layout_type=QFormLayout) -> tuple:
 
 def _dspin(mn, mx, val, step=0.05, suffix="", decimals=2) -> QDoubleSpinBox:
     w = QDoubleSpinBox()
-    w.setRange(mn, mx)
-    w.setSingleStep(step)
-    w.setValue(val)
+    # Decimals and suffix before range/value: the range and value are rounded
+    # to the current decimals, and the text is formatted once, in final form.
     w.setDecimals(decimals)
     if suffix:
         w.setSuffix(suffix)
+    w.setRange(mn, mx)
+    w.setSingleStep(step)
+    w.setValue(val)
     return w
 
 
 def _ispin(mn, mx, val, suffix="") -> QSpinBox:
     w = QSpinBox()
-    w.setRange(mn, mx)
-    w.setValue(val)
     if suffix:
         w.setSuffix(suffix)
+    w.setRange(mn, mx)
+    w.setValue(val)
     return w
 
 
-def _slider_row(mn, mx, val, label_fmt="{} %") -> tuple:
-    """Return (QHBoxLayout, QSlider, QLabel) for a slider+value row."""
-    row = QHBoxLayout()
+class _LazyCombo(QComboBox):
+    """QComboBox that emits needs_items just before the user steps through
+    its items (popup, arrow keys or mouse wheel)."""
+
+    needs_items = pyqtSignal()
+
+    def showPopup(self):
+        self.needs_items.emit()
+        super().showPopup()
+
+    def keyPressEvent(self, event):
+        self.needs_items.emit()
+        super().keyPressEvent(event)
+
+    def wheelEvent(self, event):
+        self.needs_items.emit()
+        super().wheelEvent(event)
+
+
+def _combo(items=(), min_chars=14, uniform=False, cls=QComboBox) -> QComboBox:
+    """QComboBox sized from min_chars instead of measuring every item.
+
+    uniform=True is for user-growable lists (printers / materials / presets):
+    the popup then takes one row height for all items instead of asking
+    each item for its size hint.
+    """
+    c = cls()
+    c.setSizeAdjustPolicy(QComboBox.SizeAdjustPolicy.AdjustToMinimumContentsLengthWithIcon)
+    c.setMinimumContentsLength(min_chars)
+    if uniform:
+        c.view().setUniformItemSizes(True)   # default popup view is a QListView
+    items = list(items)
+    c.addItems(items)
+    _index_items(c, items)
+    return c
+
+
+def _index_items(combo: QComboBox, items):
+    """Remember text → index for _find_text (first occurrence wins, like findText)."""
+    index = {}
+    for i, text in enumerate(items):
+        index.setdefault(text, i)
+    combo._text_index = index
+
+
+def _find_text(combo: QComboBox, text: str) -> int:
+    """O(1) findText for combos filled via _combo / _fill_combo."""
+    index = getattr(combo, '_text_index', None)
+    if index is None:
+        return combo.findText(text)
+    return index.get(text, -1)
+
+
+def _fill_combo(combo: QComboBox, names, select: str = None):
+    """Replace a combo's items in one bulk insert without signals or repaints.
+
+    If *select* is given and present it becomes current, else index 0.
+    """
+    combo.setUpdatesEnabled(False)   # one repaint after the rebuild, not per step
+    try:
+        with QSignalBlocker(combo):
+            names = list(names)
+            combo.clear()
+            combo.addItems(names)
+            _index_items(combo, names)
+            if select is not None:
+                combo.setCurrentIndex(max(_find_text(combo, select), 0))
+    finally:
+        combo.setUpdatesEnabled(True)
+
+
+def _change_signal(w):
+    """The signal a settings widget emits when the user edits it."""
+    if isinstance(w, QCheckBox):
+        return w.toggled
+    if isinstance(w, QComboBox):
+        return w.currentTextChanged
+    return w.valueChanged
+
+
+# Preset value → widget setters (picked per widget type in _widget_setter)
+def _set_spin(w, v):
+    w.setValue(v)
+
+
+def _set_check(w, v):
+    w.setChecked(bool(v))
+
+
+def _set_slider(w, v):
+    w.setValue(int(v))
+
+
+def _set_combo(w, v):
+    idx = _find_text(w, str(v))
+    if idx >= 0:
+        w.setCurrentIndex(idx)
+
+
+def _widget_setter(w):
+    if isinstance(w, QCheckBox):
+        return _set_check
+    if isinstance(w, QComboBox):
+        return _set_combo
+    if isinstance(w, QSlider):
+        return _set_slider
+    return _set_spin
+
+
+def _widget_getter(w):
+    """Bound method that reads a settings widget's current value."""
+    if isinstance(w, QCheckBox):
+        return w.isChecked
+    if isinstance(w, QComboBox):
+        return w.currentText
+    return w.value
+
+
+def _cast_read(cast, read):
+    return cast(read())
+
+
+def _slider(mn, mx, val, labels=_PCT_LABELS) -> tuple:
+    """Return (QSlider, QLabel) for a slider+value row (labels[v] is the text)."""
     sl = QSlider(Qt.Orientation.Horizontal)
     sl.setRange(mn, mx)
     sl.setValue(val)
-    lbl = QLabel(label_fmt.format(val))
+    lbl = QLabel(labels[val])
     lbl.setFixedWidth(44)
-    row.addWidget(sl)
-    row.addWidget(lbl)
-    return row, sl, lbl
+    return sl, lbl
+
+
+_SWATCH_CACHE = {}   # colour string → swatch button stylesheet
+
+
+def _swatch_css(col: str) -> str:
+    """Stylesheet for a colour swatch button (black/white text by luminance)."""
+    css = _SWATCH_CACHE.get(col)
+    if css is None:
+        r, g, b, _ = QColor(col).getRgb()   # one call instead of red/green/blue
+        lum = 0.299 * r + 0.587 * g + 0.114 * b
+        txt = '#000000' if lum > 128 else '#ffffff'
+        css = (f"background-color:{col};color:{txt};border:1px solid #888;"
+               "border-radius:2px;")
+        _SWATCH_CACHE[col] = css
+    return css
+
+
+def _hrow(*widgets) -> QHBoxLayout:
+    """Lay widgets out side by side (e.g. a slider and its value label)."""
+    row = QHBoxLayout()
+    for w in widgets:
+        row.addWidget(w)
+    return row
 
 
 # ---------------------------------------------------------------------------
@@ -135,11 +433,13 @@ class SettingsPanel(QWidget):
     Expanded settings panel with 5 tabs.
     Signals:
         settings_changed(SliceSettings)
+        settings_field_changed(str, object)  – single-field edits only
         slice_requested()
         export_requested()
     """
 
     settings_changed = pyqtSignal(object)
+    settings_field_changed = pyqtSignal(str, object)   # (field_name, value)
     slice_requested  = pyqtSignal()
     export_requested = pyqtSignal()
     theme_changed    = pyqtSignal(str, dict)   # (theme_name, custom_colors)
@@ -148,56 +448,99 @@ class SettingsPanel(QWidget):
         super().__init__(parent)
         self.setFixedWidth(300)
 
-        self._profiles_dir        = self._find_profiles_dir()
-        self._printer_profiles    = self._load_json('printers.json',  _default_printers())
-        self._material_profiles   = self._load_json('materials.json', _default_materials())
+        self._profiles_dir        = _PROFILES_DIR
+        # presets/ は一度だけ作成（_presets_dir() は以後パスを返すだけ）
+        self._presets_dir_path    = os.path.join(self._profiles_dir, 'presets')
+        os.makedirs(self._presets_dir_path, exist_ok=True)
+        # Profiles are parsed on a worker thread; see _start_profile_load
+        self._printer_profiles    = {}
+        self._material_profiles   = {}
+        self._profiles_loaded     = False
+        self._session_pending     = False
+        self._last_session_blob   = None   # bytes last written to session.json
+        self._last_session_state  = None   # _session_state() at that write
+        self._session_dirty_since = None   # monotonic time of first unsaved edit
+        # User preset caches (see _user_preset_files / _read_user_preset)
+        self._preset_files        = None   # {name: path}
+        self._preset_dir_mtime    = None
+        self._preset_cache        = {}     # {path: (mtime_ns, data)}
+        self._user_presets_listed = False
+        self._listed_presets      = None   # item tuple the preset combo holds
         self._building            = False
+        self._settings            = SliceSettings()   # kept in sync per field
+        self._last_emitted        = None   # (settings, printer profile) – see _do_emit
+        self._last_applied_preset = None   # see _apply_preset_data
+        self._compiled_builtin    = {}     # built-in key → _compile_preset plan
+        # Active printer profile + derived floats, refreshed in _on_printer_changed
+        self._current_printer_profile = {}
+        self._nozzle_diameter     = 0.4
+        self._filament_diameter   = 1.75
+        self._bed_size            = (220.0, 220.0)
+        self._has_heated_bed      = True   # mirrors bed_temp_spin.isEnabled()
+        self._printer_defaults    = {}     # id(profile) → (profile, _PrinterDefaults)
         self._current_theme       = 'Dark'
-        self._custom_colors       = dict(_DEFAULT_CUSTOM_COLORS)
+        self._custom_colors       = _DEFAULT_CUSTOM_COLORS.copy()
 
-        # セッション自動保存タイマー（最後の変更から 600ms 後に保存）
+        # セッション自動保存タイマー（最後の変更から 600ms 後に保存、
+        # 連続編集中でも _SESSION_MAX_DELAY 秒ごとには保存）
         self._session_timer = QTimer(self)
         self._session_timer.setSingleShot(True)
         self._session_timer.setInterval(600)
         self._session_timer.timeout.connect(self._save_session)
+        # Session writes run on a private single-thread pool: jobs stay in
+        # order and never race on the shared session.json.tmp file.
+        self._session_pool = QThreadPool(self)
+        self._session_pool.setMaxThreadCount(1)
+        self._session_signals = _SessionWriteSignals(self)
+        self._session_signals.failed.connect(self._on_session_write_failed)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._session_pool.waitForDone)
+
+        # settings_changed 集約タイマー（スライダードラッグ等の連続変更を 30ms でまとめる）
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(30)
+        self._emit_timer.timeout.connect(self._do_emit)
+
+        self._theme_dlg = None   # built on first show_theme_dialog()
+        self._info_box  = None   # reusable QMessageBox, built on first _info()
 
         self._setup_ui()
-        self._build_theme_dialog()   # theme widgets created here (not in a tab)
         self._connect_signals()
-        # Apply initial printer defaults (suppresses spurious signals)
-        self._on_printer_changed(self.printer_combo.currentText())
+        self._start_profile_load()
 
     # -----------------------------------------------------------------------
     # Profile loading
     # -----------------------------------------------------------------------
 
-    def _find_profiles_dir(self) -> str:
-        # When running as a PyInstaller frozen exe, sys._MEIPASS is the
-        # extracted bundle root; data files live there.
+    def _start_profile_load(self):
+        """printers.json / materials.json をワーカースレッドで読み込む。"""
         if getattr(sys, 'frozen', False):
-            return os.path.join(sys._MEIPASS, 'profiles')
-        here = os.path.dirname(os.path.abspath(__file__))
-        return os.path.join(os.path.dirname(os.path.dirname(here)), 'profiles')
-
-    def _load_json(self, filename: str, fallback: dict) -> dict:
-        # profiles/ ディレクトリがなければ作成（EXE 配布・初回起動時対策）
-        os.makedirs(self._profiles_dir, exist_ok=True)
-        path = os.path.join(self._profiles_dir, filename)
-        try:
-            with open(path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            # ファイルがなければデフォルト内容で新規作成
-            try:
-                with open(path, 'w', encoding='utf-8') as f:
-                    json.dump(fallback, f, indent=2, ensure_ascii=False)
-                print(f"[Settings] Created default {filename}")
-            except Exception as e:
-                print(f"[Settings] Could not create {filename}: {e}")
-            return fallback
-        except Exception as e:
-            print(f"[Settings] Failed to load {filename}: {e}")
-            return fallback
+            # EXE: the bundle was just extracted, so the files are in the page
+            # cache – load inline and skip the "Loading…" round trip.
+            self._on_profiles_loaded(*_load_profiles(self._profiles_dir))
+            return
+        self._profile_signals = _ProfileLoadSignals(self)
+        self._profile_signals.loaded.connect(self._on_profiles_loaded)
+        QThreadPool.globalInstance().start(
+            _ProfileLoader(self._profiles_dir, self._profile_signals))
+
+    def _on_profiles_loaded(self, printers: dict, materials: dict):
+        self._printer_profiles  = printers
+        self._material_profiles = materials
+        self._printer_defaults.clear()
+        for combo, names in ((self.printer_combo, printers),
+                             (self.material_combo, materials)):
+            _fill_combo(combo, names)
+            combo.setEnabled(True)
+        self.printer_settings_btn.setEnabled(True)
+        self._profiles_loaded = True
+        # Apply initial printer defaults (suppresses spurious signals)
+        self._on_printer_changed(self.printer_combo.currentText())
+        if self._session_pending:
+            self._session_pending = False
+            self.load_session()
 
     # -----------------------------------------------------------------------
     # UI setup
@@ -213,22 +556,18 @@ class SettingsPanel(QWidget):
 
         # Printer row: combo + settings button
         printer_row = QHBoxLayout()
-        self.printer_combo = QComboBox()
-        for n in self._printer_profiles:
-            self.printer_combo.addItem(n)
+        self.printer_combo = _combo(["Loading…"], uniform=True)
+        self.printer_combo.setEnabled(False)
         self.printer_settings_btn = QPushButton("⚙")
         self.printer_settings_btn.setFixedSize(24, 24)
         self.printer_settings_btn.setToolTip("Edit / add printer profiles")
-        self.printer_settings_btn.setStyleSheet(
-            "QPushButton{background:#444;border-radius:3px;font-size:12px;}"
-            "QPushButton:hover{background:#3a7bd5;}"
-        )
+        self.printer_settings_btn.setObjectName("gearBtn")
+        self.printer_settings_btn.setEnabled(False)
         printer_row.addWidget(self.printer_combo, stretch=1)
         printer_row.addWidget(self.printer_settings_btn)
 
-        self.material_combo = QComboBox()
-        for n in self._material_profiles:
-            self.material_combo.addItem(n)
+        self.material_combo = _combo(["Loading…"], uniform=True)
+        self.material_combo.setEnabled(False)
         top_lo.addRow("Printer:", printer_row)
         top_lo.addRow("Material:", self.material_combo)
         root.addWidget(top_gb)
@@ -236,9 +575,11 @@ class SettingsPanel(QWidget):
         # ── Preset bar ────────────────────────────────────────────────────
         preset_gb, preset_lo = _group("Presets", QVBoxLayout)
         pr_row1 = QHBoxLayout()
-        self.preset_combo = QComboBox()
+        # User presets are listed on first use (_ensure_user_presets)
+        self.preset_combo = _combo(uniform=True, cls=_LazyCombo)
         self.preset_combo.setMinimumWidth(140)
-        self._refresh_preset_combo()
+        _fill_combo(self.preset_combo, _BUILTIN_DISPLAY_NAMES)
+        self._listed_presets = _BUILTIN_DISPLAY_NAMES
         pr_row1.addWidget(self.preset_combo, stretch=1)
         preset_lo.addLayout(pr_row1)
 
@@ -271,102 +612,349 @@ class SettingsPanel(QWidget):
         root.addLayout(tools_row)
 
         # ── Tabs ─────────────────────────────────────────────────────────
+        # Inputs are created up front; pages other than Print are laid out
+        # on first show (_ensure_tab_built).
+        self._create_inputs()
+        self._build_field_bindings()
         self.tabs = QTabWidget()
         self.tabs.setTabPosition(QTabWidget.TabPosition.North)
-        self.tabs.addTab(_scroll(self._tab_print()),   "Print")
-        self.tabs.addTab(_scroll(self._tab_quality()), "Quality")
-        self.tabs.addTab(_scroll(self._tab_speed()),   "Speed")
-        self.tabs.addTab(_scroll(self._tab_support()), "Support")
-        self.tabs.addTab(_scroll(self._tab_tempfan()), "Temp/Fan")
+        self._tab_builders = {}
+        for title, builder in (("Print",    self._tab_print),
+                               ("Quality",  self._tab_quality),
+                               ("Speed",    self._tab_speed),
+                               ("Support",  self._tab_support),
+                               ("Temp/Fan", self._tab_tempfan)):
+            self._tab_builders[self.tabs.addTab(_scroll(), title)] = builder
+        self._ensure_tab_built(0)
         root.addWidget(self.tabs, stretch=1)
 
         # ── Buttons ──────────────────────────────────────────────────────
+        # Colors for #sliceBtn / #exportBtn / #gearBtn live in the app stylesheet (themes.py)
         self.slice_btn = QPushButton("SLICE NOW")
+        self.slice_btn.setObjectName("sliceBtn")
         self.slice_btn.setEnabled(False)
         self.slice_btn.setMinimumHeight(44)
-        self.slice_btn.setFont(QFont("Arial", 13, QFont.Weight.Bold))
-        self.slice_btn.setStyleSheet(
-            "QPushButton{background:#E87722;color:white;border-radius:6px;}"
-            "QPushButton:hover{background:#FF8C32;}"
-            "QPushButton:pressed{background:#C06010;}"
-            "QPushButton:disabled{background:#555;color:#888;}"
-        )
+        self.slice_btn.setFont(_SLICE_BTN_FONT)
         root.addWidget(self.slice_btn)
 
         self.export_btn = QPushButton("Export G-code")
+        self.export_btn.setObjectName("exportBtn")
         self.export_btn.setMinimumHeight(32)
         self.export_btn.setEnabled(False)
-        self.export_btn.setStyleSheet(
-            "QPushButton{background:#2255AA;color:white;border-radius:4px;}"
-            "QPushButton:hover{background:#3366CC;}"
-            "QPushButton:disabled{background:#333;color:#666;}"
-        )
         root.addWidget(self.export_btn)
 
     # -----------------------------------------------------------------------
-    # Tab: Print
+    # Spin box spec tables
+    #
+    # One row per spin box: (attribute, form label, factory, factory args,
+    # tooltip).  Custom composites (sliders, check boxes, combos) stay
+    # explicit in the tab builders.
     # -----------------------------------------------------------------------
 
-    def _tab_print(self) -> QWidget:
+    _LAYER_SPINS = (
+        ('layer_height_spin',       "Layer height:",       _dspin, (0.05, 0.50, 0.20, 0.05, " mm"), None),
+        ('first_layer_height_spin', "First layer height:", _dspin, (0.10, 0.80, 0.30, 0.05, " mm"), None),
+    )
+    _WALL_SPINS = (
+        ('wall_count_spin', "Wall count:", _ispin, (1, 10, 3), None),
+    )
+    _INFILL_SPINS = (
+        ('infill_angle_spin', "Angle:", _dspin, (0, 90, 45, 5, " °", 0), None),
+    )
+    _TOP_BOTTOM_SPINS = (
+        ('top_layers_spin',    "Top layers:",    _ispin, (0, 20, 4), None),
+        ('bottom_layers_spin', "Bottom layers:", _ispin, (0, 20, 4), None),
+    )
+    _BRIM_SPINS = (
+        ('brim_width_spin', "Brim width:", _dspin, (1.0, 30.0, 8.0, 1.0, " mm"), None),
+    )
+    _LINE_WIDTH_SPINS = (
+        ('line_width_pct_spin', "Line width:", _dspin, (70, 150, 100, 5, " %", 0),
+         "% of nozzle diameter (100% = 0.4mm for 0.4mm nozzle)"),
+    )
+    _OVERLAP_SPINS = (
+        ('infill_overlap_spin', "Infill overlap:", _dspin, (0, 50, 10, 1, " %", 0),
+         "How far infill extends into the perimeter"),
+        ('skin_overlap_spin',   "Skin overlap:",   _dspin, (0, 50,  5, 1, " %", 0),
+         "How far top/bottom extends into the perimeter"),
+    )
+    _RETRACTION_SPINS = (
+        ('retraction_dist_spin',     "Distance:",    _dspin, (0, 15, 5.0, 0.5, " mm"), None),
+        ('retraction_speed_spin',    "Speed:",       _dspin, (5, 120, 45, 5, " mm/s", 0), None),
+        ('retraction_min_dist_spin', "Min travel:",  _dspin, (0, 10, 1.5, 0.5, " mm"),
+         "Minimum travel distance to trigger retraction"),
+        ('retraction_extra_spin',    "Extra prime:", _dspin, (0, 2.0, 0.0, 0.05, " mm"),
+         "Extra filament extruded after de-retraction"),
+    )
+    _Z_HOP_SPINS = (
+        ('z_hop_spin', "Z-hop height:", _dspin, (0, 2.0, 0.0, 0.05, " mm"),
+         "Lift nozzle this height during travel moves (0 = off)"),
+    )
+    _PRINT_SPEED_SPINS = (
+        ('outer_perim_speed_spin', "Outer wall:", _dspin, (5, 300, 40, 5, " mm/s", 0),
+         "Outer wall – slower for better surface quality"),
+        ('print_speed_spin',       "Inner wall:", _dspin, (5, 300, 60, 5, " mm/s", 0), None),
+        ('top_bottom_speed_spin',  "Top/Bottom:", _dspin, (5, 300, 40, 5, " mm/s", 0), None),
+        ('infill_speed_spin',      "Infill:",     _dspin, (5, 500, 80, 5, " mm/s", 0), None),
+        ('bridge_speed_spin',      "Bridge:",     _dspin, (5, 200, 25, 5, " mm/s", 0),
+         "Speed when bridging gaps without support"),
+    )
+    _TRAVEL_SPEED_SPINS = (
+        ('first_layer_speed_spin', "First layer:", _dspin, (5, 100, 25, 5, " mm/s", 0),
+         "All features are printed at this speed on layer 1"),
+        ('travel_speed_spin',      "Travel:",      _dspin, (20, 500, 200, 10, " mm/s", 0), None),
+    )
+    _LAYER_TIME_SPINS = (
+        ('min_layer_time_spin', "Min layer time:", _dspin, (0, 60, 5, 1, " s", 0),
+         "Minimum time per layer. Print speed is reduced if layer would finish faster."),
+    )
+    _SUPPORT_DIST_SPINS = (
+        ('support_z_dist_spin',  "Z distance:",  _dspin, (0, 2.0, 0.20, 0.05, " mm"),
+         "Gap between support top/bottom and model"),
+        ('support_xy_dist_spin', "XY distance:", _dspin, (0, 3.0, 0.70, 0.05, " mm"),
+         "Horizontal gap between support and model sides"),
+    )
+    _SUPPORT_IFACE_SPINS = (
+        ('support_iface_layers', "Count:", _ispin, (1, 8, 2, " layers"), None),
+    )
+    _EXTRUDER_TEMP_SPINS = (
+        ('print_temp_spin',             "Normal temp:",      _ispin, (150, 310, 210, " °C"), None),
+        ('print_temp_first_layer_spin', "First layer temp:", _ispin, (150, 310, 215, " °C"),
+         "Higher temp on first layer improves bed adhesion"),
+    )
+    _BED_TEMP_SPINS = (
+        ('bed_temp_spin', "Bed:", _ispin, (0, 150, 60, " °C"), None),
+    )
+    _FAN_SPINS = (
+        ('fan_kick_layer_spin', "Start fan at layer:", _ispin, (1, 20, 2, " layers"),
+         "Fan starts at this layer number"),
+    )
+
+    _SPIN_SPECS = (
+        _LAYER_SPINS, _WALL_SPINS, _INFILL_SPINS, _TOP_BOTTOM_SPINS, _BRIM_SPINS,
+        _LINE_WIDTH_SPINS, _OVERLAP_SPINS, _RETRACTION_SPINS, _Z_HOP_SPINS,
+        _PRINT_SPEED_SPINS, _TRAVEL_SPEED_SPINS, _LAYER_TIME_SPINS,
+        _SUPPORT_DIST_SPINS, _SUPPORT_IFACE_SPINS,
+        _EXTRUDER_TEMP_SPINS, _BED_TEMP_SPINS, _FAN_SPINS,
+    )
+
+    # (widget attribute, SliceSettings field) for widgets wired straight to _on_field
+    _FIELD_WIDGETS = (
+        # Print
+        ('layer_height_spin',       'layer_height'),
+        ('first_layer_height_spin', 'first_layer_height'),
+        ('wall_count_spin',         'wall_count'),
+        ('outer_before_inner_chk',  'outer_before_inner'),
+        ('infill_pattern_combo',    'infill_pattern'),
+        ('infill_angle_spin',       'infill_angle'),
+        ('top_layers_spin',         'top_layers'),
+        ('bottom_layers_spin',      'bottom_layers'),
+        ('spiralize_chk',           'spiralize_mode'),
+        ('brim_width_spin',         'brim_width'),
+        # Quality
+        ('line_width_pct_spin',      'line_width_pct'),
+        ('seam_combo',               'seam_position'),
+        ('infill_overlap_spin',      'infill_overlap'),
+        ('skin_overlap_spin',        'skin_overlap'),
+        ('retraction_dist_spin',     'retraction_distance'),
+        ('retraction_speed_spin',    'retraction_speed'),
+        ('retraction_min_dist_spin', 'retraction_min_distance'),
+        ('retraction_extra_spin',    'retraction_extra_prime'),
+        ('z_hop_spin',               'retraction_z_hop'),
+        # Speed
+        ('outer_perim_speed_spin', 'outer_perimeter_speed'),
+        ('print_speed_spin',       'print_speed'),
+        ('top_bottom_speed_spin',  'top_bottom_speed'),
+        ('infill_speed_spin',      'infill_speed'),
+        ('bridge_speed_spin',      'bridge_speed'),
+        ('first_layer_speed_spin', 'first_layer_speed'),
+        ('travel_speed_spin',      'travel_speed'),
+        ('min_layer_time_spin',    'min_layer_time'),
+        # Support
+        ('support_check',         'support_enabled'),
+        ('support_pattern_combo', 'support_pattern'),
+        ('support_z_dist_spin',   'support_z_distance'),
+        ('support_xy_dist_spin',  'support_xy_distance'),
+        ('support_iface_check',   'support_interface_enabled'),
+        ('support_iface_layers',  'support_interface_layers'),
+        # Temp/Fan
+        ('print_temp_spin',             'print_temp'),
+        ('print_temp_first_layer_spin', 'print_temp_first_layer'),
+        ('bed_temp_spin',               'bed_temp'),
+        ('fan_kick_layer_spin',         'fan_kick_in_layer'),
+    )
+
+    # Checkboxes whose slot also enables/disables dependent inputs
+    _TOGGLE_FIELDS = (
+        # (widget attribute, field, slot)
+        ('brim_check',       'brim_enabled',       '_on_brim_toggle'),
+        ('retraction_check', 'retraction_enabled', '_on_retraction_toggle'),
+    )
+
+    # Sliders with a value label beside them
+    _SLIDER_FIELDS = (
+        # (slider attribute, field, label attribute, label table, cast)
+        ('infill_slider',          'infill_density',    'infill_val_lbl',      _PCT_LABELS, float),
+        ('support_thresh_slider',  'support_threshold', 'support_thresh_lbl',  _DEG_LABELS, float),
+        ('support_density_slider', 'support_density',   'support_density_lbl', _PCT_LABELS, float),
+        ('fan_slider',             'fan_speed',         'fan_lbl',             _PCT_LABELS, int),
+        ('fan_fl_slider',          'fan_first_layer',   'fan_fl_lbl',          _PCT_LABELS, int),
+    )
+
+    # -----------------------------------------------------------------------
+    # Input widgets
+    # -----------------------------------------------------------------------
+
+    def _create_inputs(self):
+        """Create every settings input widget.
+
+        The widgets hold the live settings (_read_settings reads them), so they
+        exist from the start even though only the Print page is laid out
+        eagerly; the other pages are assembled on first show.
+        """
+        for spec in self._SPIN_SPECS:
+            for attr, _label, factory, args, tip in spec:
+                w = factory(*args)
+                if tip:
+                    w.setToolTip(tip)
+                setattr(self, attr, w)
+
+        # Print tab
+        self.outer_before_inner_chk = QCheckBox("Outer wall first")
+        self.outer_before_inner_chk.setChecked(False)
+        self.spiralize_chk = QCheckBox("ノンストップ印刷モード（つなぎ目なし）")
+        self.spiralize_chk.setToolTip(
+            "各層の外周を連続螺旋状に印刷します。\n"
+            "Z上昇と横移動を同時に行うためつなぎ目がなくなります。\n"
+            "インフィル・トップ層は無視され、ベース層のみソリッドになります。"
+        )
+        self.infill_slider, self.infill_val_lbl = _slider(0, 100, 20)
+        self.infill_pattern_combo = _combo(['grid', 'lines', 'honeycomb'])
+        self.brim_check = QCheckBox("Enable brim")
+        self.brim_width_spin.setEnabled(False)
+
+        # Quality tab
+        self.seam_combo = _combo(['back', 'random', 'sharpest'])
+        self.seam_combo.setToolTip(
+            "back: seam always at the back of the model\n"
+            "random: random position each layer\n"
+            "sharpest: nearest sharp corner"
+        )
+        self.retraction_check = QCheckBox("Enable retraction")
+        self.retraction_check.setChecked(True)
+
+        # Support tab
+        self.support_check = QCheckBox("Enable supports")
+        self.support_thresh_slider, self.support_thresh_lbl = _slider(20, 80, 45, _DEG_LABELS)
+        self.support_thresh_slider.setToolTip(
+            "Faces angled more than this from vertical get support"
+        )
+        self.support_pattern_combo = _combo(['lines', 'grid', 'zigzag'])
+        self.support_density_slider, self.support_density_lbl = _slider(5, 50, 15)
+        self.support_iface_check = QCheckBox("Interface layers")
+        self.support_iface_check.setChecked(True)
+        self.support_iface_check.setToolTip(
+            "Dense layers at the top of supports for easier removal"
+        )
+
+        # Temp/Fan tab
+        self.fan_slider,    self.fan_lbl    = _slider(0, 100, 100)
+        self.fan_fl_slider, self.fan_fl_lbl = _slider(0, 100, 0)
+
+    def _spin_rows(self, lo: QFormLayout, spec: tuple):
+        """Add the spin boxes described by *spec* to *lo*."""
+        for attr, label, *_ in spec:
+            lo.addRow(label, getattr(self, attr))
+
+    @staticmethod
+    def _tab_page() -> tuple:
+        """Return (QWidget, QVBoxLayout) for a tab page."""
         w = QWidget()
         vl = QVBoxLayout(w)
         vl.setContentsMargins(4, 4, 4, 4)
         vl.setSpacing(6)
+        return w, vl
+
+    def _build_field_bindings(self):
+        """Derive the per-field widget access from the field tables.
+
+        _preset_bindings: {field: (widget, setter)} – used by _apply_preset_data
+        _field_readers:   [(field, read)]          – used by _read_settings
+        _quiet_widgets:   every bound widget – signals blocked during a preset load
+        """
+        pairs = [(f, a, None) for a, f in self._FIELD_WIDGETS]
+        pairs += [(f, a, None) for a, f, _ in self._TOGGLE_FIELDS]
+        pairs += [(f, a, cast) for a, f, _, _, cast in self._SLIDER_FIELDS]
+        self._preset_bindings = {}
+        self._field_readers   = []
+        for field, attr, cast in pairs:
+            w = getattr(self, attr)
+            self._preset_bindings[field] = (w, _widget_setter(w))
+            read = _widget_getter(w)
+            if cast is not None:
+                read = partial(_cast_read, cast, read)
+            self._field_readers.append((field, read))
+        self._quiet_widgets = tuple(w for w, _ in self._preset_bindings.values())
+
+    def _sync_derived_ui(self):
+        """Re-derive slider labels and toggle-dependent enabled state.
+
+        Their slots normally keep these current; call this after changing
+        the widgets with signals blocked (_batch).
+        """
+        for attr, _field, slot in self._TOGGLE_FIELDS:
+            getattr(self, slot)(getattr(self, attr).isChecked())
+        for attr, _field, label_attr, labels, _cast in self._SLIDER_FIELDS:
+            getattr(self, label_attr).setText(labels[getattr(self, attr).value()])
+
+    def _ensure_tab_built(self, index: int):
+        """Lay out a tab page the first time it is shown."""
+        builder = self._tab_builders.pop(index, None)
+        if builder is not None:
+            self.tabs.widget(index).setWidget(builder())
+            if not self._tab_builders:
+                # Every page is built – stop paying for the tab-switch hook
+                self.tabs.currentChanged.disconnect(self._ensure_tab_built)
+
+    # -----------------------------------------------------------------------
+    # Tab: Print
+    # -----------------------------------------------------------------------
+
+    def _tab_print(self) -> QWidget:
+        w, vl = self._tab_page()
 
         # Layer heights
         gb1, lo1 = _group("Layer")
-        self.layer_height_spin       = _dspin(0.05, 0.50, 0.20, 0.05, " mm")
-        self.first_layer_height_spin = _dspin(0.10, 0.80, 0.30, 0.05, " mm")
-        lo1.addRow("Layer height:",       self.layer_height_spin)
-        lo1.addRow("First layer height:", self.first_layer_height_spin)
+        self._spin_rows(lo1, self._LAYER_SPINS)
         vl.addWidget(gb1)
 
         # Walls
         gb2, lo2 = _group("Walls")
-        self.wall_count_spin = _ispin(1, 10, 3)
-        self.outer_before_inner_chk = QCheckBox("Outer wall first")
-        self.outer_before_inner_chk.setChecked(False)
-        lo2.addRow("Wall count:", self.wall_count_spin)
+        self._spin_rows(lo2, self._WALL_SPINS)
         lo2.addRow("", self.outer_before_inner_chk)
         vl.addWidget(gb2)
 
         # Spiralize (Non-stop / Vase) mode
         gb_sp, lo_sp = _group("Non-stop (Spiralize / Vase)")
-        self.spiralize_chk = QCheckBox("ノンストップ印刷モード（つなぎ目なし）")
-        self.spiralize_chk.setToolTip(
-            "各層の外周を連続螺旋状に印刷します。\n"
-            "Z上昇と横移動を同時に行うためつなぎ目がなくなります。\n"
-            "インフィル・トップ層は無視され、ベース層のみソリッドになります。"
-        )
         lo_sp.addRow("", self.spiralize_chk)
         vl.addWidget(gb_sp)
 
         # Infill
         gb3, lo3 = _group("Infill")
-        row_inf, self.infill_slider, self.infill_val_lbl = _slider_row(0, 100, 20, "{} %")
-        self.infill_pattern_combo = QComboBox()
-        self.infill_pattern_combo.addItems(['grid', 'lines', 'honeycomb'])
-        self.infill_angle_spin = _dspin(0, 90, 45, 5, " °", 0)
-        lo3.addRow("Infill density:", row_inf)
+        lo3.addRow("Infill density:", _hrow(self.infill_slider, self.infill_val_lbl))
         lo3.addRow("Pattern:",        self.infill_pattern_combo)
-        lo3.addRow("Angle:",          self.infill_angle_spin)
+        self._spin_rows(lo3, self._INFILL_SPINS)
         vl.addWidget(gb3)
 
         # Top / Bottom
         gb4, lo4 = _group("Top / Bottom layers")
-        self.top_layers_spin    = _ispin(0, 20, 4)
-        self.bottom_layers_spin = _ispin(0, 20, 4)
-        lo4.addRow("Top layers:",    self.top_layers_spin)
-        lo4.addRow("Bottom layers:", self.bottom_layers_spin)
+        self._spin_rows(lo4, self._TOP_BOTTOM_SPINS)
         vl.addWidget(gb4)
 
         # Brim
         gb5, lo5 = _group("Brim")
-        self.brim_check      = QCheckBox("Enable brim")
-        self.brim_width_spin = _dspin(1.0, 30.0, 8.0, 1.0, " mm")
-        self.brim_width_spin.setEnabled(False)
         lo5.addRow("", self.brim_check)
-        lo5.addRow("Brim width:", self.brim_width_spin)
+        self._spin_rows(lo5, self._BRIM_SPINS)
         vl.addWidget(gb5)
 
         vl.addStretch()
@@ -377,62 +965,32 @@ class SettingsPanel(QWidget):
     # -----------------------------------------------------------------------
 
     def _tab_quality(self) -> QWidget:
-        w = QWidget()
-        vl = QVBoxLayout(w)
-        vl.setContentsMargins(4, 4, 4, 4)
-        vl.setSpacing(6)
+        w, vl = self._tab_page()
 
         # Line width
         gb1, lo1 = _group("Extrusion width")
-        self.line_width_pct_spin = _dspin(70, 150, 100, 5, " %", 0)
-        self.line_width_pct_spin.setToolTip("% of nozzle diameter (100% = 0.4mm for 0.4mm nozzle)")
-        lo1.addRow("Line width:", self.line_width_pct_spin)
+        self._spin_rows(lo1, self._LINE_WIDTH_SPINS)
         vl.addWidget(gb1)
 
         # Seam
         gb2, lo2 = _group("Seam position")
-        self.seam_combo = QComboBox()
-        self.seam_combo.addItems(['back', 'random', 'sharpest'])
-        self.seam_combo.setToolTip(
-            "back: seam always at the back of the model\n"
-            "random: random position each layer\n"
-            "sharpest: nearest sharp corner"
-        )
         lo2.addRow("Seam:", self.seam_combo)
         vl.addWidget(gb2)
 
         # Overlap
         gb3, lo3 = _group("Overlap / adhesion")
-        self.infill_overlap_spin  = _dspin(0, 50, 10, 1, " %", 0)
-        self.skin_overlap_spin    = _dspin(0, 50,  5, 1, " %", 0)
-        self.infill_overlap_spin.setToolTip("How far infill extends into the perimeter")
-        self.skin_overlap_spin.setToolTip("How far top/bottom extends into the perimeter")
-        lo3.addRow("Infill overlap:", self.infill_overlap_spin)
-        lo3.addRow("Skin overlap:",   self.skin_overlap_spin)
+        self._spin_rows(lo3, self._OVERLAP_SPINS)
         vl.addWidget(gb3)
 
         # Retraction
         gb4, lo4 = _group("Retraction")
-        self.retraction_check         = QCheckBox("Enable retraction")
-        self.retraction_check.setChecked(True)
-        self.retraction_dist_spin     = _dspin(0, 15, 5.0, 0.5, " mm")
-        self.retraction_speed_spin    = _dspin(5, 120, 45, 5, " mm/s", 0)
-        self.retraction_min_dist_spin = _dspin(0, 10, 1.5, 0.5, " mm")
-        self.retraction_extra_spin    = _dspin(0, 2.0, 0.0, 0.05, " mm")
         lo4.addRow("", self.retraction_check)
-        lo4.addRow("Distance:",       self.retraction_dist_spin)
-        lo4.addRow("Speed:",          self.retraction_speed_spin)
-        lo4.addRow("Min travel:",     self.retraction_min_dist_spin)
-        lo4.addRow("Extra prime:",    self.retraction_extra_spin)
-        self.retraction_min_dist_spin.setToolTip("Minimum travel distance to trigger retraction")
-        self.retraction_extra_spin.setToolTip("Extra filament extruded after de-retraction")
+        self._spin_rows(lo4, self._RETRACTION_SPINS)
         vl.addWidget(gb4)
 
         # Z-hop
         gb5, lo5 = _group("Z-hop (lift on travel)")
-        self.z_hop_spin = _dspin(0, 2.0, 0.0, 0.05, " mm")
-        self.z_hop_spin.setToolTip("Lift nozzle this height during travel moves (0 = off)")
-        lo5.addRow("Z-hop height:", self.z_hop_spin)
+        self._spin_rows(lo5, self._Z_HOP_SPINS)
         vl.addWidget(gb5)
 
         vl.addStretch()
@@ -443,40 +1001,18 @@ class SettingsPanel(QWidget):
     # -----------------------------------------------------------------------
 
     def _tab_speed(self) -> QWidget:
-        w = QWidget()
-        vl = QVBoxLayout(w)
-        vl.setContentsMargins(4, 4, 4, 4)
-        vl.setSpacing(6)
+        w, vl = self._tab_page()
 
         gb1, lo1 = _group("Print speeds")
-        self.outer_perim_speed_spin = _dspin(5, 300, 40, 5, " mm/s", 0)
-        self.print_speed_spin       = _dspin(5, 300, 60, 5, " mm/s", 0)
-        self.top_bottom_speed_spin  = _dspin(5, 300, 40, 5, " mm/s", 0)
-        self.infill_speed_spin      = _dspin(5, 500, 80, 5, " mm/s", 0)
-        self.bridge_speed_spin      = _dspin(5, 200, 25, 5, " mm/s", 0)
-        self.outer_perim_speed_spin.setToolTip("Outer wall – slower for better surface quality")
-        self.bridge_speed_spin.setToolTip("Speed when bridging gaps without support")
-        lo1.addRow("Outer wall:",   self.outer_perim_speed_spin)
-        lo1.addRow("Inner wall:",   self.print_speed_spin)
-        lo1.addRow("Top/Bottom:",   self.top_bottom_speed_spin)
-        lo1.addRow("Infill:",       self.infill_speed_spin)
-        lo1.addRow("Bridge:",       self.bridge_speed_spin)
+        self._spin_rows(lo1, self._PRINT_SPEED_SPINS)
         vl.addWidget(gb1)
 
         gb2, lo2 = _group("First layer & travel")
-        self.first_layer_speed_spin = _dspin(5, 100, 25, 5, " mm/s", 0)
-        self.travel_speed_spin      = _dspin(20, 500, 200, 10, " mm/s", 0)
-        self.first_layer_speed_spin.setToolTip("All features are printed at this speed on layer 1")
-        lo2.addRow("First layer:",  self.first_layer_speed_spin)
-        lo2.addRow("Travel:",       self.travel_speed_spin)
+        self._spin_rows(lo2, self._TRAVEL_SPEED_SPINS)
         vl.addWidget(gb2)
 
         gb3, lo3 = _group("Layer time")
-        self.min_layer_time_spin = _dspin(0, 60, 5, 1, " s", 0)
-        self.min_layer_time_spin.setToolTip(
-            "Minimum time per layer. Print speed is reduced if layer would finish faster."
-        )
-        lo3.addRow("Min layer time:", self.min_layer_time_spin)
+        self._spin_rows(lo3, self._LAYER_TIME_SPINS)
         vl.addWidget(gb3)
 
         vl.addStretch()
@@ -487,46 +1023,24 @@ class SettingsPanel(QWidget):
     # -----------------------------------------------------------------------
 
     def _tab_support(self) -> QWidget:
-        w = QWidget()
-        vl = QVBoxLayout(w)
-        vl.setContentsMargins(4, 4, 4, 4)
-        vl.setSpacing(6)
+        w, vl = self._tab_page()
 
         gb1, lo1 = _group("Support structure")
-        self.support_check = QCheckBox("Enable supports")
-        row_thr, self.support_thresh_slider, self.support_thresh_lbl = \
-            _slider_row(20, 80, 45, "{}°")
-        self.support_thresh_slider.setToolTip(
-            "Faces angled more than this from vertical get support"
-        )
-        self.support_pattern_combo = QComboBox()
-        self.support_pattern_combo.addItems(['lines', 'grid', 'zigzag'])
-        row_den, self.support_density_slider, self.support_density_lbl = \
-            _slider_row(5, 50, 15, "{} %")
         lo1.addRow("", self.support_check)
-        lo1.addRow("Overhang angle:", row_thr)
+        lo1.addRow("Overhang angle:",
+                   _hrow(self.support_thresh_slider, self.support_thresh_lbl))
         lo1.addRow("Pattern:", self.support_pattern_combo)
-        lo1.addRow("Density:", row_den)
+        lo1.addRow("Density:",
+                   _hrow(self.support_density_slider, self.support_density_lbl))
         vl.addWidget(gb1)
 
         gb2, lo2 = _group("Support distance")
-        self.support_z_dist_spin  = _dspin(0, 2.0, 0.20, 0.05, " mm")
-        self.support_xy_dist_spin = _dspin(0, 3.0, 0.70, 0.05, " mm")
-        self.support_z_dist_spin.setToolTip("Gap between support top/bottom and model")
-        self.support_xy_dist_spin.setToolTip("Horizontal gap between support and model sides")
-        lo2.addRow("Z distance:",  self.support_z_dist_spin)
-        lo2.addRow("XY distance:", self.support_xy_dist_spin)
+        self._spin_rows(lo2, self._SUPPORT_DIST_SPINS)
         vl.addWidget(gb2)
 
         gb3, lo3 = _group("Support interface")
-        self.support_iface_check  = QCheckBox("Interface layers")
-        self.support_iface_check.setChecked(True)
-        self.support_iface_layers = _ispin(1, 8, 2, " layers")
-        self.support_iface_check.setToolTip(
-            "Dense layers at the top of supports for easier removal"
-        )
         lo3.addRow("", self.support_iface_check)
-        lo3.addRow("Count:", self.support_iface_layers)
+        self._spin_rows(lo3, self._SUPPORT_IFACE_SPINS)
         vl.addWidget(gb3)
 
         vl.addStretch()
@@ -537,34 +1051,20 @@ class SettingsPanel(QWidget):
     # -----------------------------------------------------------------------
 
     def _tab_tempfan(self) -> QWidget:
-        w = QWidget()
-        vl = QVBoxLayout(w)
-        vl.setContentsMargins(4, 4, 4, 4)
-        vl.setSpacing(6)
+        w, vl = self._tab_page()
 
         gb1, lo1 = _group("Extruder temperature")
-        self.print_temp_spin            = _ispin(150, 310, 210, " °C")
-        self.print_temp_first_layer_spin = _ispin(150, 310, 215, " °C")
-        self.print_temp_first_layer_spin.setToolTip(
-            "Higher temp on first layer improves bed adhesion"
-        )
-        lo1.addRow("Normal temp:",      self.print_temp_spin)
-        lo1.addRow("First layer temp:", self.print_temp_first_layer_spin)
+        self._spin_rows(lo1, self._EXTRUDER_TEMP_SPINS)
         vl.addWidget(gb1)
 
         gb2, lo2 = _group("Bed temperature")
-        self.bed_temp_spin = _ispin(0, 150, 60, " °C")
-        lo2.addRow("Bed:", self.bed_temp_spin)
+        self._spin_rows(lo2, self._BED_TEMP_SPINS)
         vl.addWidget(gb2)
 
         gb3, lo3 = _group("Cooling fan")
-        row_fan, self.fan_slider, self.fan_lbl = _slider_row(0, 100, 100)
-        row_fl,  self.fan_fl_slider, self.fan_fl_lbl = _slider_row(0, 100, 0)
-        self.fan_kick_layer_spin = _ispin(1, 20, 2, " layers")
-        self.fan_kick_layer_spin.setToolTip("Fan starts at this layer number")
-        lo3.addRow("Normal speed:",       row_fan)
-        lo3.addRow("First layer speed:",  row_fl)
-        lo3.addRow("Start fan at layer:", self.fan_kick_layer_spin)
+        lo3.addRow("Normal speed:",      _hrow(self.fan_slider, self.fan_lbl))
+        lo3.addRow("First layer speed:", _hrow(self.fan_fl_slider, self.fan_fl_lbl))
+        self._spin_rows(lo3, self._FAN_SPINS)
         vl.addWidget(gb3)
 
         vl.addStretch()
@@ -575,7 +1075,10 @@ class SettingsPanel(QWidget):
     # -----------------------------------------------------------------------
 
     def _build_theme_dialog(self):
-        """Create the persistent theme dialog and all theme widgets."""
+        """Create the persistent theme dialog and all theme widgets.
+
+        Built on first use; the widgets start from the current theme state.
+        """
         from PyQt6.QtWidgets import QDialog
         from PyQt6.QtCore import Qt as _Qt
 
@@ -594,7 +1097,8 @@ class SettingsPanel(QWidget):
         theme_lbl.setFixedWidth(70)
         self.theme_combo = QComboBox()
         self.theme_combo.addItems(THEME_NAMES)
-        idx = self.theme_combo.findText(self._current_theme)
+        _index_items(self.theme_combo, THEME_NAMES)
+        idx = _find_text(self.theme_combo, self._current_theme)
         if idx >= 0:
             self.theme_combo.setCurrentIndex(idx)
         theme_row.addWidget(theme_lbl)
@@ -617,10 +1121,15 @@ class SettingsPanel(QWidget):
         cl.addRow("Text:",       self.color_text_btn)
         cl.addRow("Accent:",     self.color_accent_btn)
         lo.addWidget(self.custom_colors_widget)
-        self.custom_colors_widget.setVisible(False)
+        self.custom_colors_widget.setVisible(self._current_theme == 'Custom')
 
         self._update_color_swatches()
 
+        self.theme_combo.currentTextChanged.connect(self._on_theme_combo_changed)
+        self.color_bg_btn.clicked.connect(partial(self._pick_color, 'background'))
+        self.color_text_btn.clicked.connect(partial(self._pick_color, 'text'))
+        self.color_accent_btn.clicked.connect(partial(self._pick_color, 'accent'))
+
         # ── Close button ──────────────────────────────────────────────────
         close_btn = QPushButton("Close")
         close_btn.clicked.connect(dlg.hide)
@@ -631,6 +1140,8 @@ class SettingsPanel(QWidget):
 
     def show_theme_dialog(self):
         """Show the theme dialog (called from main_window Setting menu)."""
+        if self._theme_dlg is None:
+            self._build_theme_dialog()
         self._theme_dlg.show()
         self._theme_dlg.raise_()
         self._theme_dlg.activateWindow()
@@ -640,63 +1151,22 @@ class SettingsPanel(QWidget):
     # -----------------------------------------------------------------------
 
     def _connect_signals(self):
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
         self.printer_combo.currentTextChanged.connect(self._on_printer_changed)
         self.material_combo.currentTextChanged.connect(self._on_material_changed)
         self.printer_settings_btn.clicked.connect(self._on_printer_settings)
 
-        # Print tab
-        self.layer_height_spin.valueChanged.connect(self._emit)
-        self.first_layer_height_spin.valueChanged.connect(self._emit)
-        self.wall_count_spin.valueChanged.connect(self._emit)
-        self.outer_before_inner_chk.toggled.connect(self._emit)
-        self.infill_slider.valueChanged.connect(self._on_infill_slider)
-        self.infill_pattern_combo.currentTextChanged.connect(self._emit)
-        self.infill_angle_spin.valueChanged.connect(self._emit)
-        self.top_layers_spin.valueChanged.connect(self._emit)
-        self.bottom_layers_spin.valueChanged.connect(self._emit)
-        self.spiralize_chk.toggled.connect(self._emit)
-        self.brim_check.toggled.connect(self._on_brim_toggle)
-        self.brim_width_spin.valueChanged.connect(self._emit)
+        # Plain widgets: value → _on_field(field, value)
+        for attr, field in self._FIELD_WIDGETS:
+            w = getattr(self, attr)
+            _change_signal(w).connect(partial(self._on_field, field))
 
-        # Quality tab
-        self.line_width_pct_spin.valueChanged.connect(self._emit)
-        self.seam_combo.currentTextChanged.connect(self._emit)
-        self.infill_overlap_spin.valueChanged.connect(self._emit)
-        self.skin_overlap_spin.valueChanged.connect(self._emit)
-        self.retraction_check.toggled.connect(self._on_retraction_toggle)
-        self.retraction_dist_spin.valueChanged.connect(self._emit)
-        self.retraction_speed_spin.valueChanged.connect(self._emit)
-        self.retraction_min_dist_spin.valueChanged.connect(self._emit)
-        self.retraction_extra_spin.valueChanged.connect(self._emit)
-        self.z_hop_spin.valueChanged.connect(self._emit)
-
-        # Speed tab
-        self.outer_perim_speed_spin.valueChanged.connect(self._emit)
-        self.print_speed_spin.valueChanged.connect(self._emit)
-        self.top_bottom_speed_spin.valueChanged.connect(self._emit)
-        self.infill_speed_spin.valueChanged.connect(self._emit)
-        self.bridge_speed_spin.valueChanged.connect(self._emit)
-        self.first_layer_speed_spin.valueChanged.connect(self._emit)
-        self.travel_speed_spin.valueChanged.connect(self._emit)
-        self.min_layer_time_spin.valueChanged.connect(self._emit)
-
-        # Support tab
-        self.support_check.toggled.connect(self._emit)
-        self.support_thresh_slider.valueChanged.connect(self._on_support_thresh)
-        self.support_pattern_combo.currentTextChanged.connect(self._emit)
-        self.support_density_slider.valueChanged.connect(self._on_support_density)
-        self.support_z_dist_spin.valueChanged.connect(self._emit)
-        self.support_xy_dist_spin.valueChanged.connect(self._emit)
-        self.support_iface_check.toggled.connect(self._emit)
-        self.support_iface_layers.valueChanged.connect(self._emit)
-
-        # Temp/Fan tab
-        self.print_temp_spin.valueChanged.connect(self._emit)
-        self.print_temp_first_layer_spin.valueChanged.connect(self._emit)
-        self.bed_temp_spin.valueChanged.connect(self._emit)
-        self.fan_slider.valueChanged.connect(self._on_fan)
-        self.fan_fl_slider.valueChanged.connect(self._on_fan_fl)
-        self.fan_kick_layer_spin.valueChanged.connect(self._emit)
+        # Widgets with extra UI side effects (labels / enabled state)
+        for attr, field, slot in self._TOGGLE_FIELDS:
+            getattr(self, attr).toggled.connect(getattr(self, slot))
+        for attr, field, label_attr, labels, cast in self._SLIDER_FIELDS:
+            getattr(self, attr).valueChanged.connect(
+                partial(self._on_slider, field, getattr(self, label_attr), labels, cast))
 
         # Tools row (reset / import / export settings)
         self.reset_btn.clicked.connect(self._on_reset)
@@ -704,59 +1174,113 @@ class SettingsPanel(QWidget):
         self.export_settings_btn.clicked.connect(self._on_export_settings)
 
         # Preset buttons
+        self.preset_combo.needs_items.connect(self._ensure_user_presets)
         self.preset_load_btn.clicked.connect(self._on_preset_load)
         self.preset_save_btn.clicked.connect(self._on_preset_save)
         self.preset_delete_btn.clicked.connect(self._on_preset_delete)
 
-        # Help tab – theme
-        self.theme_combo.currentTextChanged.connect(self._on_theme_combo_changed)
-        self.color_bg_btn.clicked.connect(lambda: self._pick_color('background'))
-        self.color_text_btn.clicked.connect(lambda: self._pick_color('text'))
-        self.color_accent_btn.clicked.connect(lambda: self._pick_color('accent'))
-
         # Buttons
-        self.slice_btn.clicked.connect(self.slice_requested)
-        self.export_btn.clicked.connect(self.export_requested)
+        self.slice_btn.clicked.connect(self._on_slice_clicked)
+        self.export_btn.clicked.connect(self._on_export_clicked)
 
     # -----------------------------------------------------------------------
     # Slot helpers
     # -----------------------------------------------------------------------
 
+    def _warn(self, title: str, msg: str):
+        """Warning dialog parented to the panel."""
+        QMessageBox.warning(self, title, msg)
+
+    def _info(self, title: str, msg: str):
+        """Information box; one instance is kept and reused for every notice."""
+        box = self._info_box
+        if box is None:
+            box = self._info_box = QMessageBox(self)
+            box.setIcon(QMessageBox.Icon.Information)
+            box.setStandardButtons(QMessageBox.StandardButton.Ok)
+        box.setWindowTitle(title)
+        box.setText(msg)
+        box.exec()
+
+    @contextmanager
+    def _batch(self, widgets):
+        """Block the widgets' signals for a bulk update; the caller emits once after.
+
+        Plain blockSignals() with the previous states restored – what a
+        QSignalBlocker per widget does, minus an ExitStack entry for each.
+        """
+        was_blocked = [w.blockSignals(True) for w in widgets]
+        try:
+            yield
+        finally:
+            for w, was in zip(widgets, was_blocked):
+                w.blockSignals(was)
+
     def _emit(self, *_):
+        """Full rebuild from the widgets – used after bulk (_building) updates."""
         if not self._building:
-            self.settings_changed.emit(self.get_settings())
-            self._session_timer.start()  # デバウンス: 600ms 後に自動保存
-
-    def _on_infill_slider(self, v):
-        self.infill_val_lbl.setText(f"{v} %")
-        self._emit()
+            self._last_applied_preset = None
+            self._settings = self._read_settings()
+            self._emit_timer.start()
+
+    def _do_emit(self):
+        """Emit settings_changed with a snapshot of the cached settings.
+
+        Skipped when neither the settings nor the printer profile differ
+        from the last emit (e.g. a slider dragged away and back). The session
+        save is scheduled either way: a printer/material switch can leave
+        every field unchanged, and _save_session skips no-op writes itself.
+        """
+        self._schedule_session_save()  # デバウンス: 600ms 後に自動保存
+        s, profile = self._settings, self._current_printer_profile
+        last = self._last_emitted
+        if last is not None and last[1] is profile and last[0] == s:
+            return
+        snapshot = dataclasses.replace(s)
+        self._last_emitted = (snapshot, profile)
+        self.settings_changed.emit(snapshot)
+
+    def flush_settings(self):
+        """Deliver a pending settings_changed now (call before slice/export)."""
+        if self._emit_timer.isActive():
+            self._emit_timer.stop()
+            self._do_emit()
+
+    def _on_slice_clicked(self):
+        self.flush_settings()
+        self.slice_requested.emit()
+
+    def _on_export_clicked(self):
+        self.flush_settings()
+        self.export_requested.emit()
+
+    def _on_field(self, name: str, value):
+        """Single-widget edit: patch one field of the cached settings and emit."""
+        if self._building:
+            return
+        self._last_applied_preset = None   # user edit – a reload must re-apply
+        s = self._settings
+        setattr(s, name, value)
+        if name == 'line_width_pct':
+            s.line_width = s.nozzle_diameter * value / 100.0
+        self.settings_field_changed.emit(name, value)
+        self._emit_timer.start()
+
+    def _on_slider(self, name, label, labels, cast, v):
+        """Slider → value label + settings field (bound per slider via partial)."""
+        label.setText(labels[v])
+        self._on_field(name, cast(v))
 
     def _on_brim_toggle(self, checked):
         self.brim_width_spin.setEnabled(checked)
-        self._emit()
+        self._on_field('brim_enabled', checked)
 
     def _on_retraction_toggle(self, checked):
         for w in (self.retraction_dist_spin, self.retraction_speed_spin,
                   self.retraction_min_dist_spin, self.retraction_extra_spin,
                   self.z_hop_spin):
             w.setEnabled(checked)
-        self._emit()
-
-    def _on_support_thresh(self, v):
-        self.support_thresh_lbl.setText(f"{v}°")
-        self._emit()
-
-    def _on_support_density(self, v):
-        self.support_density_lbl.setText(f"{v} %")
-        self._emit()
-
-    def _on_fan(self, v):
-        self.fan_lbl.setText(f"{v} %")
-        self._emit()
-
-    def _on_fan_fl(self, v):
-        self.fan_fl_lbl.setText(f"{v} %")
-        self._emit()
+        self._on_field('retraction_enabled', checked)
 
     # -----------------------------------------------------------------------
     # Reset / Import / Export settings
@@ -772,104 +1296,97 @@ class SettingsPanel(QWidget):
         if reply != QMessageBox.StandardButton.Yes:
             return
         self._apply_preset_data(self._get_default_data())
-        self._session_timer.start()
+        self._schedule_session_save()
 
     def _get_default_data(self) -> dict:
-        return {
-            '_printer': 'Generic Printer', '_material': 'PLA',
-            'layer_height': 0.2,   'first_layer_height': 0.3,
-            'wall_count': 3,       'outer_before_inner': False,
-            'spiralize_mode': False,
-            'infill_density': 20,  'infill_pattern': 'grid', 'infill_angle': 45.0,
-            'top_layers': 4,       'bottom_layers': 4,
-            'brim_enabled': False, 'brim_width': 8.0,
-            'line_width_pct': 100.0, 'seam_position': 'back',
-            'infill_overlap': 10.0, 'skin_overlap': 5.0,
-            'retraction_enabled': True,
-            'retraction_distance': 5.0,   'retraction_speed': 45.0,
-            'retraction_min_distance': 1.5, 'retraction_extra_prime': 0.0,
-            'retraction_z_hop': 0.0,
-            'outer_perimeter_speed': 40.0, 'print_speed': 60.0,
-            'top_bottom_speed': 40.0,      'infill_speed': 80.0,
-            'bridge_speed': 25.0,          'first_layer_speed': 25.0,
-            'travel_speed': 200.0,         'min_layer_time': 5.0,
-            'support_enabled': False,      'support_threshold': 45,
-            'support_pattern': 'lines',    'support_density': 15,
-            'support_z_distance': 0.2,     'support_xy_distance': 0.7,
-            'support_interface_enabled': True, 'support_interface_layers': 2,
-            'print_temp': 210, 'print_temp_first_layer': 215, 'bed_temp': 60,
-            'fan_speed': 100,  'fan_first_layer': 0,          'fan_kick_in_layer': 2,
-        }
+        """Reset values: SliceSettings defaults for every bound field."""
+        data = {'_printer': 'Generic Printer', '_material': 'PLA'}
+        data.update((field, getattr(_SS_DEFAULTS, field)) for field in self._preset_bindings)
+        return data
 
     def _on_import_settings(self):
         """Import settings from a user-chosen JSON file."""
         path, _ = QFileDialog.getOpenFileName(
             self, "Import Settings", "",
-            "Settings files (*.json);;All Files (*)"
+            "Settings files (*.json);;All Files (*)",
+            options=_FILE_DIALOG_OPTIONS
         )
         if not path:
             return
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = read_json(path)
             self._apply_preset_data(data)
             # Restore theme if present
             if '_theme' in data:
                 self._current_theme   = data['_theme']
-                self._custom_colors   = data.get('_custom_colors', dict(_DEFAULT_CUSTOM_COLORS))
-                idx = self.theme_combo.findText(self._current_theme)
-                if idx >= 0:
-                    self.theme_combo.blockSignals(True)
-                    self.theme_combo.setCurrentIndex(idx)
-                    self.theme_combo.blockSignals(False)
-                self.custom_colors_widget.setVisible(self._current_theme == 'Custom')
-                self._update_color_swatches()
+                colors = data.get('_custom_colors')
+                self._custom_colors   = (colors if colors is not None
+                                         else _DEFAULT_CUSTOM_COLORS.copy())
+                self._sync_theme_widgets()
                 self.theme_changed.emit(self._current_theme, self._custom_colors)
-            self._session_timer.start()
+            self._schedule_session_save()
         except Exception as e:
-            QMessageBox.warning(self, "Import Error", f"Failed to import settings:\n{e}")
+            self._warn("Import Error", f"Failed to import settings:\n{e}")
 
     def _on_export_settings(self):
         """Export current settings to a user-chosen JSON file."""
         path, _ = QFileDialog.getSaveFileName(
             self, "Export Settings", "settings.json",
-            "Settings files (*.json);;All Files (*)"
+            "Settings files (*.json);;All Files (*)",
+            options=_FILE_DIALOG_OPTIONS
         )
         if not path:
             return
         try:
-            s    = self.get_settings()
-            data = dataclasses.asdict(s)
-            data['_printer']      = self.printer_combo.currentText()
-            data['_material']     = self.material_combo.currentText()
-            data['_theme']        = self._current_theme
-            data['_custom_colors'] = self._custom_colors
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            QMessageBox.information(self, "Exported",
-                                    f"Settings saved to:\n{path}")
+            write_json(path, self._settings_to_dict(include_theme=True))
+            self._info("Exported", f"Settings saved to:\n{path}")
         except Exception as e:
-            QMessageBox.warning(self, "Export Error", f"Failed to export settings:\n{e}")
+            self._warn("Export Error", f"Failed to export settings:\n{e}")
 
     # -----------------------------------------------------------------------
     # Printer / Material changed
     # -----------------------------------------------------------------------
 
+    def _defaults_for(self, profile: dict) -> _PrinterDefaults:
+        """Normalised defaults for profile, parsed once per profile dict."""
+        hit = self._printer_defaults.get(id(profile))
+        if hit is not None and hit[0] is profile:
+            return hit[1]
+        defaults = _PrinterDefaults.from_profile(profile)
+        self._printer_defaults[id(profile)] = (profile, defaults)
+        return defaults
+
     def _on_printer_changed(self, name: str):
-        profile = self._printer_profiles.get(name, {})
-        self._building = True
+        profile  = self._printer_profiles.get(name, {})
+        defaults = self._defaults_for(profile)
+        self._current_printer_profile = profile
+        self._nozzle_diameter   = defaults.nozzle_diameter
+        self._filament_diameter = defaults.filament_diameter
+        self._bed_size          = defaults.bed_size
+        speed_spins = (self.outer_perim_speed_spin, self.print_speed_spin,
+                       self.top_bottom_speed_spin, self.infill_speed_spin,
+                       self.bridge_speed_spin, self.first_layer_speed_spin,
+                       self.travel_speed_spin)
+        with self._batch((self.bed_temp_spin, self.layer_height_spin,
+                          self.first_layer_height_spin, self.retraction_dist_spin,
+                          self.retraction_speed_spin) + speed_spins):
+            self._apply_printer_limits(defaults)
+        self._emit()  # settings_changed emit + セッション保存タイマー起動
 
+    def _apply_printer_limits(self, d: _PrinterDefaults):
+        """Printer constraints + defaults (signals blocked by the caller)."""
         # Bed temp constraints
-        bed_max = int(profile.get('bed_temp_max', 100))
+        bed_max = d.bed_temp_max
         self.bed_temp_spin.setMaximum(max(bed_max, 0))
         has_bed = bed_max > 0
+        self._has_heated_bed = has_bed
         self.bed_temp_spin.setEnabled(has_bed)
         self.bed_temp_spin.setToolTip("" if has_bed else "No heated bed on this printer")
         if not has_bed:
             self.bed_temp_spin.setValue(0)
 
         # Speed constraints
-        max_spd = float(profile.get('max_print_speed', 300))
+        max_spd = d.max_print_speed
         for sp in (self.outer_perim_speed_spin, self.print_speed_spin,
                    self.top_bottom_speed_spin, self.bridge_speed_spin,
                    self.first_layer_speed_spin):
@@ -878,8 +1395,8 @@ class SettingsPanel(QWidget):
         self.travel_speed_spin.setMaximum(max_spd * 3)
 
         # Apply printer-specific defaults
-        if 'default_print_speed' in profile:
-            spd = float(profile['default_print_speed'])
+        if d.print_speed is not None:
+            spd = d.print_speed
             self.outer_perim_speed_spin.setValue(spd * 0.6)
             self.print_speed_spin.setValue(spd)
             self.top_bottom_speed_spin.setValue(spd * 0.6)
@@ -888,19 +1405,15 @@ class SettingsPanel(QWidget):
             self.first_layer_speed_spin.setValue(spd * 0.5)
             self.travel_speed_spin.setValue(min(spd * 3, 200))
 
-        if 'default_layer_height' in profile:
-            lh = float(profile['default_layer_height'])
-            self.layer_height_spin.setValue(lh)
-            self.first_layer_height_spin.setValue(lh)
-
-        if 'default_retraction_distance' in profile:
-            self.retraction_dist_spin.setValue(float(profile['default_retraction_distance']))
+        if d.layer_height is not None:
+            self.layer_height_spin.setValue(d.layer_height)
+            self.first_layer_height_spin.setValue(d.layer_height)
 
-        if 'default_retraction_speed' in profile:
-            self.retraction_speed_spin.setValue(float(profile['default_retraction_speed']))
+        if d.retraction_dist is not None:
+            self.retraction_dist_spin.setValue(d.retraction_dist)
 
-        self._building = False
-        self._emit()  # settings_changed emit + セッション保存タイマー起動
+        if d.retraction_speed is not None:
+            self.retraction_speed_spin.setValue(d.retraction_speed)
 
     def _on_printer_settings(self):
         """Open the printer configuration dialog."""
@@ -912,33 +1425,30 @@ class SettingsPanel(QWidget):
             # Reload profiles and refresh the combo
             current = self.printer_combo.currentText()
             self._printer_profiles = dlg.get_profiles()
+            self._printer_defaults.clear()   # profiles may have been edited
 
-            self.printer_combo.blockSignals(True)
-            self.printer_combo.clear()
-            for n in self._printer_profiles:
-                self.printer_combo.addItem(n)
             # Restore selection if still present
-            idx = self.printer_combo.findText(current)
-            self.printer_combo.setCurrentIndex(idx if idx >= 0 else 0)
-            self.printer_combo.blockSignals(False)
+            _fill_combo(self.printer_combo, self._printer_profiles, current)
 
             # Re-apply printer defaults
             self._on_printer_changed(self.printer_combo.currentText())
 
     def _on_material_changed(self, name: str):
         mat = self._material_profiles.get(name, {})
-        self._building = True
-        if 'print_temp' in mat:
-            t = int(mat['print_temp'])
-            self.print_temp_spin.setValue(t)
-            self.print_temp_first_layer_spin.setValue(min(t + 5, 310))
-        if 'bed_temp' in mat and self.bed_temp_spin.isEnabled():
-            self.bed_temp_spin.setValue(int(mat['bed_temp']))
-        if 'fan_speed' in mat:
-            self.fan_slider.setValue(int(mat['fan_speed']))
-        if 'retraction' in mat:
-            self.retraction_dist_spin.setValue(float(mat['retraction']))
-        self._building = False
+        with self._batch((self.print_temp_spin, self.print_temp_first_layer_spin,
+                          self.bed_temp_spin, self.fan_slider,
+                          self.retraction_dist_spin)):
+            if 'print_temp' in mat:
+                t = int(mat['print_temp'])
+                self.print_temp_spin.setValue(t)
+                self.print_temp_first_layer_spin.setValue(min(t + 5, 310))
+            if 'bed_temp' in mat and self._has_heated_bed:
+                self.bed_temp_spin.setValue(int(mat['bed_temp']))
+            if 'fan_speed' in mat:
+                self.fan_slider.setValue(int(mat['fan_speed']))
+                self.fan_lbl.setText(_PCT_LABELS[self.fan_slider.value()])
+            if 'retraction' in mat:
+                self.retraction_dist_spin.setValue(float(mat['retraction']))
         self._emit()
 
     # -----------------------------------------------------------------------
@@ -946,89 +1456,128 @@ class SettingsPanel(QWidget):
     # -----------------------------------------------------------------------
 
     def _presets_dir(self) -> str:
-        d = os.path.join(self._profiles_dir, 'presets')
-        os.makedirs(d, exist_ok=True)
-        return d
+        return self._presets_dir_path
 
     def _user_preset_files(self) -> dict:
-        """Return {display_name: filepath} for all user presets."""
+        """Return {display_name: filepath} for all user presets.
+
+        The listing is cached and only rescanned when the presets
+        directory's mtime changes (file added/removed outside the app).
+        """
         d = self._presets_dir()
-        result = {}
-        for fn in sorted(os.listdir(d)):
-            if fn.endswith('.json') and not fn.startswith('_'):
-                name = fn[:-5]  # strip .json
-                result[name] = os.path.join(d, fn)
+        try:
+            mtime = os.stat(d).st_mtime_ns
+        except FileNotFoundError:
+            # presets/ was removed while running – recreate it (empty listing)
+            os.makedirs(d, exist_ok=True)
+            mtime = os.stat(d).st_mtime_ns
+        if self._preset_files is not None and mtime == self._preset_dir_mtime:
+            return self._preset_files
+        # scandir: DirEntry carries the type info, no extra stat per entry
+        with os.scandir(d) as it:
+            entries = sorted(
+                (e.name[:-5], e.path) for e in it   # strip .json
+                if e.name.endswith('.json') and not e.name.startswith('_')
+                and e.is_file()
+            )
+        result = dict(entries)
+        self._preset_files     = result
+        self._preset_dir_mtime = mtime
         return result
 
-    def _refresh_preset_combo(self):
-        self.preset_combo.blockSignals(True)
-        self.preset_combo.clear()
+    def _restamp_preset_dir(self):
+        """Our own save/delete bumped the directory mtime; the listing was
+        patched in place, so mark it current instead of forcing a rescan."""
+        self._preset_dir_mtime = os.stat(self._presets_dir()).st_mtime_ns
+
+    def _read_user_preset(self, path: str) -> dict:
+        """Parse a user preset, reusing the cached dict while its mtime is unchanged."""
+        mtime = os.stat(path).st_mtime_ns
+        cached = self._preset_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        data = read_json(path)
+        self._preset_cache[path] = (mtime, data)
+        return data
 
-        # Built-in presets
-        for name in _BUILTIN_PRESETS:
-            self.preset_combo.addItem(f"[Built-in] {name}")
-
-        # User presets
-        for name in self._user_preset_files():
-            self.preset_combo.addItem(name)
-
-        self.preset_combo.blockSignals(False)
+    def _refresh_preset_combo(self):
+        # Built-in presets first, then user presets
+        self._user_presets_listed = True
+        names = _BUILTIN_DISPLAY_NAMES + tuple(self._user_preset_files())
+        if names == self._listed_presets:
+            return   # combo already shows exactly these (e.g. overwrite-save)
+        self._listed_presets = names
+        _fill_combo(self.preset_combo, names, self.preset_combo.currentText())
+
+    def _ensure_user_presets(self):
+        """First use of the preset combo: scan the presets directory."""
+        if not self._user_presets_listed:
+            self._refresh_preset_combo()
 
     def _on_preset_load(self):
         text = self.preset_combo.currentText()
         if not text:
             return
 
-        if text.startswith("[Built-in] "):
-            key = text[len("[Built-in] "):]
+        if text.startswith(_BUILTIN_PREFIX):
+            key = text[_BUILTIN_PREFIX_LEN:]
             data = _BUILTIN_PRESETS.get(key, {})
-            self._apply_preset_data(data)
+            plan = self._compiled_builtin.get(key)
+            if plan is None:
+                plan = self._compiled_builtin[key] = self._compile_preset(data)
+            self._apply_preset_data(data, plan)
             return
 
         # User preset
         files = self._user_preset_files()
         path = files.get(text)
-        if path and os.path.isfile(path):
+        if path:
             try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                self._apply_preset_data(data)
+                self._apply_preset_data(self._read_user_preset(path))
+            except FileNotFoundError:
+                # Removed outside the app – drop the stale entry
+                self._preset_files = None
+                self._refresh_preset_combo()
             except Exception as e:
-                QMessageBox.warning(self, "Preset Error", f"Failed to load preset:\n{e}")
+                self._warn("Preset Error", f"Failed to load preset:\n{e}")
 
     def _on_preset_save(self):
         # Get name from user
         name, ok = QInputDialog.getText(
             self, "Save Preset", "Preset name:",
-            text=self.preset_combo.currentText().replace("[Built-in] ", "")
+            text=self.preset_combo.currentText().replace(_BUILTIN_PREFIX, "")
         )
         if not ok or not name.strip():
             return
-        name = name.strip().replace('/', '_').replace('\\', '_')
+        name = name.strip().translate(_NAME_SANITIZE)
 
-        s = self.get_settings()
-        data = dataclasses.asdict(s)
-        # Also store which printer/material is selected
-        data['_printer'] = self.printer_combo.currentText()
-        data['_material'] = self.material_combo.currentText()
+        data = self._settings_to_dict()
 
         path = os.path.join(self._presets_dir(), f"{name}.json")
         try:
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            files = self._user_preset_files()   # validate the listing pre-write
+            write_json(path, data)
+            if name in files:
+                # Overwrite of a listed preset – the listing is still exact
+                self._restamp_preset_dir()
+            else:
+                # New name – rescan, since the file system may be case-
+                # insensitive ("draft" can overwrite "Draft.json" on Windows)
+                self._preset_files = None
+            self._preset_cache[path] = (os.stat(path).st_mtime_ns, data)
             self._refresh_preset_combo()
             # Select the saved preset
-            idx = self.preset_combo.findText(name)
+            idx = _find_text(self.preset_combo, name)
             if idx >= 0:
                 self.preset_combo.setCurrentIndex(idx)
-            QMessageBox.information(self, "Saved", f"Preset '{name}' saved.")
+            self._info("Saved", f"Preset '{name}' saved.")
         except Exception as e:
-            QMessageBox.warning(self, "Save Error", f"Could not save preset:\n{e}")
+            self._warn("Save Error", f"Could not save preset:\n{e}")
 
     def _on_preset_delete(self):
         text = self.preset_combo.currentText()
-        if text.startswith("[Built-in] "):
-            QMessageBox.information(self, "Cannot Delete", "Built-in presets cannot be deleted.")
+        if text.startswith(_BUILTIN_PREFIX):
+            self._info("Cannot Delete", "Built-in presets cannot be deleted.")
             return
         files = self._user_preset_files()
         path = files.get(text)
@@ -1041,182 +1590,99 @@ class SettingsPanel(QWidget):
         )
         if reply == QMessageBox.StandardButton.Yes:
             try:
+                files = self._user_preset_files()   # re-validate after the dialog
                 os.remove(path)
+                self._preset_cache.pop(path, None)
+                files.pop(text, None)
+                self._restamp_preset_dir()
                 self._refresh_preset_combo()
             except Exception as e:
-                QMessageBox.warning(self, "Delete Error", str(e))
-
-    def _apply_preset_data(self, data: dict):
-        """Apply a preset dict to all UI controls."""
+                self._warn("Delete Error", str(e))
+
+    def _compile_preset(self, data) -> tuple:
+        """Resolve a preset to (widget, setter, value) steps, in data order.
+
+        Keys without a bound widget (_printer, _material, unknown) are dropped.
+        Built-in presets never change, so _on_preset_load keeps their plans.
+        """
+        bindings = self._preset_bindings
+        return tuple((*bindings[key], value)
+                     for key, value in data.items() if key in bindings)
+
+    def _apply_preset_data(self, data: dict, plan: tuple = None):
+        """Apply a preset dict to all UI controls (only the keys it contains).
+
+        *plan* is a precompiled _compile_preset(data); built when omitted.
+        """
+        if data == self._last_applied_preset:
+            return   # nothing changed since this exact data was applied
+        if plan is None:
+            plan = self._compile_preset(data)
         self._building = True
         try:
-            # Printer / material
+            # Printer / material first – they set limits the values below rely on
             if '_printer' in data:
-                idx = self.printer_combo.findText(data['_printer'])
+                idx = _find_text(self.printer_combo, data['_printer'])
                 if idx >= 0:
                     self.printer_combo.setCurrentIndex(idx)
             if '_material' in data:
-                idx = self.material_combo.findText(data['_material'])
+                idx = _find_text(self.material_combo, data['_material'])
                 if idx >= 0:
                     self.material_combo.setCurrentIndex(idx)
 
-            def sv(spin, key):
-                if key in data and spin is not None:
-                    try: spin.setValue(data[key])
-                    except Exception: pass
-
-            def sc(chk, key):
-                if key in data and chk is not None:
-                    chk.setChecked(bool(data[key]))
-
-            def scombo(combo, key):
-                if key in data and combo is not None:
-                    idx = combo.findText(str(data[key]))
-                    if idx >= 0: combo.setCurrentIndex(idx)
-
-            # Print tab
-            sc(self.spiralize_chk,           'spiralize_mode')
-            sv(self.layer_height_spin,       'layer_height')
-            sv(self.first_layer_height_spin, 'first_layer_height')
-            sv(self.wall_count_spin,         'wall_count')
-            sc(self.outer_before_inner_chk,  'outer_before_inner')
-            if 'infill_density' in data:
-                self.infill_slider.setValue(int(data['infill_density']))
-            scombo(self.infill_pattern_combo,'infill_pattern')
-            sv(self.infill_angle_spin,       'infill_angle')
-            sv(self.top_layers_spin,         'top_layers')
-            sv(self.bottom_layers_spin,      'bottom_layers')
-            sc(self.brim_check,              'brim_enabled')
-            sv(self.brim_width_spin,         'brim_width')
-
-            # Quality tab
-            sv(self.line_width_pct_spin,      'line_width_pct')
-            scombo(self.seam_combo,           'seam_position')
-            sv(self.infill_overlap_spin,      'infill_overlap')
-            sv(self.skin_overlap_spin,        'skin_overlap')
-            sc(self.retraction_check,         'retraction_enabled')
-            sv(self.retraction_dist_spin,     'retraction_distance')
-            sv(self.retraction_speed_spin,    'retraction_speed')
-            sv(self.retraction_min_dist_spin, 'retraction_min_distance')
-            sv(self.retraction_extra_spin,    'retraction_extra_prime')
-            sv(self.z_hop_spin,               'retraction_z_hop')
-
-            # Speed tab
-            sv(self.outer_perim_speed_spin,  'outer_perimeter_speed')
-            sv(self.print_speed_spin,        'print_speed')
-            sv(self.top_bottom_speed_spin,   'top_bottom_speed')
-            sv(self.infill_speed_spin,       'infill_speed')
-            sv(self.bridge_speed_spin,       'bridge_speed')
-            sv(self.first_layer_speed_spin,  'first_layer_speed')
-            sv(self.travel_speed_spin,       'travel_speed')
-            sv(self.min_layer_time_spin,     'min_layer_time')
-
-            # Support tab
-            sc(self.support_check,           'support_enabled')
-            if 'support_threshold' in data:
-                self.support_thresh_slider.setValue(int(data['support_threshold']))
-            scombo(self.support_pattern_combo,'support_pattern')
-            if 'support_density' in data:
-                self.support_density_slider.setValue(int(data['support_density']))
-            sv(self.support_z_dist_spin,     'support_z_distance')
-            sv(self.support_xy_dist_spin,    'support_xy_distance')
-            sc(self.support_iface_check,     'support_interface_enabled')
-            sv(self.support_iface_layers,    'support_interface_layers')
-
-            # Temp/Fan tab
-            sv(self.print_temp_spin,              'print_temp')
-            sv(self.print_temp_first_layer_spin,  'print_temp_first_layer')
-            if self.bed_temp_spin.isEnabled():
-                sv(self.bed_temp_spin,            'bed_temp')
-            if 'fan_speed' in data:
-                self.fan_slider.setValue(int(data['fan_speed']))
-            if 'fan_first_layer' in data:
-                self.fan_fl_slider.setValue(int(data['fan_first_layer']))
-            sv(self.fan_kick_layer_spin,          'fan_kick_in_layer')
+            bed_temp_spin = self.bed_temp_spin
+            has_bed = self._has_heated_bed
+            with self._batch(self._quiet_widgets):
+                for widget, setter, value in plan:
+                    if widget is bed_temp_spin and not has_bed:
+                        continue   # printer has no heated bed
+                    try:
+                        setter(widget, value)
+                    except Exception:
+                        pass
+            self._sync_derived_ui()   # slots were skipped while blocked
 
         finally:
             self._building = False
             self._emit()
+        self._last_applied_preset = dict(data)
+
+    def _settings_to_dict(self, include_theme: bool = False) -> dict:
+        """Settings + selected printer/material (+ theme) as a JSON-ready dict.
+
+        Shared by export, preset save and the session autosave; reads the
+        per-edit _settings cache, not the widgets.
+        """
+        data = _settings_dict(self._settings)
+        data['_printer']  = self.printer_combo.currentText()
+        data['_material'] = self.material_combo.currentText()
+        if include_theme:
+            data['_theme']         = self._current_theme
+            data['_custom_colors'] = self._custom_colors
+        return data
 
     # -----------------------------------------------------------------------
     # Public API
     # -----------------------------------------------------------------------
 
     def get_settings(self) -> SliceSettings:
-        s = SliceSettings()
-
-        # Printer profile
-        pname = self.printer_combo.currentText()
-        prof  = self._printer_profiles.get(pname, {})
-        s.nozzle_diameter   = float(prof.get('nozzle_diameter',   0.4))
-        s.filament_diameter = float(prof.get('filament_diameter', 1.75))
-
-        # Layer / extrusion
-        s.layer_height       = self.layer_height_spin.value()
-        s.first_layer_height = self.first_layer_height_spin.value()
-        s.line_width_pct     = self.line_width_pct_spin.value()
-        s.line_width         = s.nozzle_diameter * s.line_width_pct / 100.0
-
-        # Spiralize mode
-        s.spiralize_mode = self.spiralize_chk.isChecked()
-
-        # Walls
-        s.wall_count         = self.wall_count_spin.value()
-        s.outer_before_inner = self.outer_before_inner_chk.isChecked()
-        s.seam_position      = self.seam_combo.currentText()
-
-        # Infill
-        s.infill_density  = float(self.infill_slider.value())
-        s.infill_pattern  = self.infill_pattern_combo.currentText()
-        s.infill_angle    = self.infill_angle_spin.value()
-        s.infill_overlap  = self.infill_overlap_spin.value()
-
-        # Top/bottom
-        s.top_layers    = self.top_layers_spin.value()
-        s.bottom_layers = self.bottom_layers_spin.value()
-        s.skin_overlap  = self.skin_overlap_spin.value()
-
-        # Brim
-        s.brim_enabled = self.brim_check.isChecked()
-        s.brim_width   = self.brim_width_spin.value()
-
-        # Retraction
-        s.retraction_enabled      = self.retraction_check.isChecked()
-        s.retraction_distance     = self.retraction_dist_spin.value()
-        s.retraction_speed        = self.retraction_speed_spin.value()
-        s.retraction_min_distance = self.retraction_min_dist_spin.value()
-        s.retraction_extra_prime  = self.retraction_extra_spin.value()
-        s.retraction_z_hop        = self.z_hop_spin.value()
-
-        # Speeds
-        s.outer_perimeter_speed = self.outer_perim_speed_spin.value()
-        s.print_speed           = self.print_speed_spin.value()
-        s.top_bottom_speed      = self.top_bottom_speed_spin.value()
-        s.infill_speed          = self.infill_speed_spin.value()
-        s.bridge_speed          = self.bridge_speed_spin.value()
-        s.first_layer_speed     = self.first_layer_speed_spin.value()
-        s.travel_speed          = self.travel_speed_spin.value()
-        s.min_layer_time        = self.min_layer_time_spin.value()
-
-        # Support
-        s.support_enabled           = self.support_check.isChecked()
-        s.support_threshold         = float(self.support_thresh_slider.value())
-        s.support_pattern           = self.support_pattern_combo.currentText()
-        s.support_density           = float(self.support_density_slider.value())
-        s.support_z_distance        = self.support_z_dist_spin.value()
-        s.support_xy_distance       = self.support_xy_dist_spin.value()
-        s.support_interface_enabled = self.support_iface_check.isChecked()
-        s.support_interface_layers  = self.support_iface_layers.value()
-
-        # Temp / fan
-        s.print_temp             = self.print_temp_spin.value()
-        s.print_temp_first_layer = self.print_temp_first_layer_spin.value()
-        s.bed_temp               = self.bed_temp_spin.value()
-        s.fan_speed              = self.fan_slider.value()
-        s.fan_first_layer        = self.fan_fl_slider.value()
-        s.fan_kick_in_layer      = self.fan_kick_layer_spin.value()
-
-        return s
+        """Current settings – a copy of the per-edit cache, no widget reads."""
+        return dataclasses.replace(self._settings)
+
+    def _read_settings(self) -> SliceSettings:
+        """Read every field from its widget (see _build_field_bindings).
+
+        Only needed after bulk updates made with signals blocked (_emit);
+        single edits keep self._settings current through _on_field.
+        """
+        nozzle = self._nozzle_diameter     # cached by _on_printer_changed
+        values = {field: read() for field, read in self._field_readers}
+        return SliceSettings(
+            line_width        = nozzle * values['line_width_pct'] / 100.0,
+            nozzle_diameter   = nozzle,
+            filament_diameter = self._filament_diameter,
+            **values,
+        )
 
     # -----------------------------------------------------------------------
     # Theme handling
@@ -1226,7 +1692,7 @@ class SettingsPanel(QWidget):
         self._current_theme = name
         self.custom_colors_widget.setVisible(name == 'Custom')
         self.theme_changed.emit(name, self._custom_colors)
-        self._session_timer.start()
+        self._schedule_session_save()
 
     def _pick_color(self, key: str):
         """Open a color picker and update the custom color for key."""
@@ -1237,20 +1703,27 @@ class SettingsPanel(QWidget):
             self._update_color_swatches()
             if self._current_theme == 'Custom':
                 self.theme_changed.emit('Custom', self._custom_colors)
-                self._session_timer.start()
+                self._schedule_session_save()
+
+    def _sync_theme_widgets(self):
+        """Push the current theme state into the dialog, if it exists yet."""
+        if self._theme_dlg is None:
+            return   # _build_theme_dialog reads the state when first shown
+        idx = _find_text(self.theme_combo, self._current_theme)
+        if idx >= 0:
+            with QSignalBlocker(self.theme_combo):
+                self.theme_combo.setCurrentIndex(idx)
+        self.custom_colors_widget.setVisible(self._current_theme == 'Custom')
+        self._update_color_swatches()
 
     def _update_color_swatches(self):
         """Update button backgrounds to show chosen custom colors."""
         def _swatch(btn, key):
             col = self._custom_colors.get(key, '#888888')
-            c   = QColor(col)
-            lum = 0.299 * c.red() + 0.587 * c.green() + 0.114 * c.blue()
-            txt = '#000000' if lum > 128 else '#ffffff'
+            css = _swatch_css(col)
             btn.setText(col)
-            btn.setStyleSheet(
-                f"background-color:{col};color:{txt};border:1px solid #888;"
-                "border-radius:2px;"
-            )
+            if btn.styleSheet() != css:   # re-polish only on a real change
+                btn.setStyleSheet(css)
         _swatch(self.color_bg_btn,     'background')
         _swatch(self.color_text_btn,   'text')
         _swatch(self.color_accent_btn, 'accent')
@@ -1263,28 +1736,62 @@ class SettingsPanel(QWidget):
         """セッション保存ファイルのパス。"""
         return os.path.join(self._profiles_dir, 'session.json')
 
+    def _schedule_session_save(self):
+        """Debounce the autosave, but never defer it past _SESSION_MAX_DELAY."""
+        now = time.monotonic()
+        if self._session_dirty_since is None:
+            self._session_dirty_since = now
+        elif now - self._session_dirty_since >= _SESSION_MAX_DELAY:
+            self._save_session()   # edits kept restarting the timer
+            return
+        self._session_timer.start()
+
     def _save_session(self):
         """現在の全設定を session.json へ保存する（タイマーから呼ばれる）。"""
+        self._session_timer.stop()
+        self._session_dirty_since = None
+        if not self._profiles_loaded:
+            return   # combos still show the "Loading…" placeholder
         try:
-            s = self.get_settings()
-            data = dataclasses.asdict(s)
-            data['_printer']       = self.printer_combo.currentText()
-            data['_material']      = self.material_combo.currentText()
-            data['_theme']         = self._current_theme
-            data['_custom_colors'] = self._custom_colors
-            with open(self._session_path(), 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            state = self._session_state()
+            if state == self._last_session_state:
+                return   # nothing changed since the last write – skip dict + dumps
+            data = self._settings_to_dict(include_theme=True)
+            blob = json_dumps(data)
+            self._last_session_state = (dataclasses.replace(state[0]),) + state[1:]
+            if blob == self._last_session_blob:
+                return   # e.g. an edit that was undone before the timer fired
+            self._last_session_blob = blob   # reset by _on_session_write_failed
+            self._session_pool.start(
+                _SessionWriter(self._session_path(), blob, self._session_signals))
         except Exception as e:
             print(f"[Settings] Session save failed: {e}")
 
+    def _session_state(self) -> tuple:
+        """Everything session.json stores, as a cheaply comparable tuple."""
+        return (self._settings,
+                self.printer_combo.currentText(),
+                self.material_combo.currentText(),
+                self._current_theme,
+                tuple(self._custom_colors.items()))
+
+    def _on_session_write_failed(self, blob: bytes, msg: str):
+        print(f"[Settings] Session save failed: {msg}")
+        if blob == self._last_session_blob:
+            self._last_session_blob  = None   # let the next save retry
+            self._last_session_state = None
+
     def load_session(self):
         """session.json から前回の設定を復元する（起動時に呼ぶ）。"""
+        if not self._profiles_loaded:
+            # プロファイル読込完了後に _on_profiles_loaded から再実行
+            self._session_pending = True
+            return
         path = self._session_path()
         if not os.path.isfile(path):
             return
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = read_json(path)
             self._apply_preset_data(data)
 
             # Restore theme
@@ -1292,24 +1799,17 @@ class SettingsPanel(QWidget):
                 self._current_theme = data['_theme']
                 if '_custom_colors' in data:
                     self._custom_colors = data['_custom_colors']
-                self._update_color_swatches()
-                self.theme_combo.blockSignals(True)
-                idx = self.theme_combo.findText(self._current_theme)
-                if idx >= 0:
-                    self.theme_combo.setCurrentIndex(idx)
-                self.theme_combo.blockSignals(False)
-                self.custom_colors_widget.setVisible(self._current_theme == 'Custom')
+                self._sync_theme_widgets()
                 # Emit so main_window applies theme on startup
                 self.theme_changed.emit(self._current_theme, self._custom_colors)
         except Exception as e:
             print(f"[Settings] Session load failed: {e}")
 
     def get_printer_profile(self) -> dict:
-        return self._printer_profiles.get(self.printer_combo.currentText(), {})
+        return self._current_printer_profile   # cached by _on_printer_changed
 
     def get_bed_size(self) -> tuple:
-        bed = self.get_printer_profile().get('bed_size', [220, 220])
-        return float(bed[0]), float(bed[1])
+        return self._bed_size                  # cached by _on_printer_changed
 
     def set_slice_enabled(self, enabled: bool):
         self.slice_btn.setEnabled(enabled)
@@ -1322,188 +1822,182 @@ class SettingsPanel(QWidget):
 # Fallback defaults
 # ---------------------------------------------------------------------------
 
-def _default_printers() -> dict:
-    """Full printer list – used as fallback AND to recreate printers.json if missing."""
-    return {
-        'Bambu Lab X1C': {
-            'bed_size': [256, 256], 'bed_temp_max': 120,
-            'nozzle_diameter': 0.4, 'filament_diameter': 1.75,
-            'max_print_speed': 500, 'default_print_speed': 200,
-            'default_layer_height': 0.2,
-            'default_retraction_distance': 1.0, 'default_retraction_speed': 45,
-            'start_gcode': 'G28\nG29\nG92 E0',
-            'end_gcode': 'M104 S0\nM140 S0\nG28 X0\nM84',
-        },
-        'Bambu Lab P1P': {
-            'bed_size': [256, 256], 'bed_temp_max': 100,
-            'nozzle_diameter': 0.4, 'filament_diameter': 1.75,
-            'max_print_speed': 500, 'default_print_speed': 200,
-            'default_layer_height': 0.2,
-            'default_retraction_distance': 1.0, 'default_retraction_speed': 45,
-            'start_gcode': 'G28\nG92 E0',
-            'end_gcode': 'M104 S0\nM140 S0\nG28 X0\nM84',
-        },
-        'Prusa MK4': {
-            'bed_size': [250, 210], 'bed_temp_max': 110,
-            'nozzle_diameter': 0.4, 'filament_diameter': 1.75,
-            'max_print_speed': 300, 'default_print_speed': 60,
-            'default_layer_height': 0.2,
-            'default_retraction_distance': 2.0, 'default_retraction_speed': 45,
-            'start_gcode': 'G28\nG29\nG92 E0',
-            'end_gcode': 'M104 S0\nM140 S0\nG91\nG1 E-1 F300\nG1 Z1\nG90\nM84',
-        },
-        'Creality Ender-3': {
-            'bed_size': [220, 220], 'bed_temp_max': 110,
-            'nozzle_diameter': 0.4, 'filament_diameter': 1.75,
-            'max_print_speed': 150, 'default_print_speed': 50,
-            'default_layer_height': 0.2,
-            'default_retraction_distance': 5.0, 'default_retraction_speed': 45,
-            'start_gcode': 'G28\nG92 E0\nG1 Z2.0 F3000\nG1 X0.1 Y20 Z0.3 F5000\nG1 X0.1 Y150 E15 F1500\nG92 E0',
-            'end_gcode': 'G91\nG1 E-5 F300\nG1 Z10 F3000\nG90\nG28 X0\nM84\nM104 S0\nM140 S0',
-        },
-        'Easythreed K9': {
-            'bed_size': [100, 100], 'bed_temp_max': 0,
-            'nozzle_diameter': 0.4, 'filament_diameter': 1.75,
-            'max_print_speed': 40, 'default_print_speed': 30,
-            'default_layer_height': 0.3,
-            'default_retraction_distance': 6.5, 'default_retraction_speed': 25,
-            'start_gcode': 'T0\nM104 S{print_temp}\nM105\nM109 S{print_temp}\nM82\nG28\nG1 Z15.0 F6000\nG92 E0\nG1 F200 E3\nG92 E0\nG1 F1500 E-6.5',
-            'end_gcode': 'M104 S0\nM140 S0\nG28 X0 Y0\nM84\nM82\nM104 S0',
-        },
-        'Generic Printer': {
-            'bed_size': [220, 220], 'bed_temp_max': 100,
-            'nozzle_diameter': 0.4, 'filament_diameter': 1.75,
-            'max_print_speed': 300, 'default_print_speed': 60,
-            'default_layer_height': 0.2,
-            'default_retraction_distance': 5.0, 'default_retraction_speed': 45,
-            'start_gcode': 'G28\nG92 E0',
-            'end_gcode': 'M104 S0\nM140 S0\nM84',
-        },
-    }
-
-
-def _default_materials() -> dict:
-    """Full material list – used as fallback AND to recreate materials.json if missing."""
-    return {
-        'PLA':  {'print_temp': 210, 'bed_temp': 60,  'fan_speed': 100, 'retraction': 5.0},
-        'PETG': {'print_temp': 235, 'bed_temp': 80,  'fan_speed': 50,  'retraction': 6.0},
-        'ABS':  {'print_temp': 240, 'bed_temp': 100, 'fan_speed': 0,   'retraction': 5.0},
-        'TPU':  {'print_temp': 225, 'bed_temp': 60,  'fan_speed': 50,  'retraction': 1.0},
-        'ASA':  {'print_temp': 245, 'bed_temp': 100, 'fan_speed': 20,  'retraction': 5.0},
-    }
+# Full printer list – used as fallback AND to recreate printers.json if missing.
+# Shared by every panel instance, so frozen (see the end of this section).
+_DEFAULT_PRINTERS = {
+    'Bambu Lab X1C': {
+        'bed_size': [256, 256], 'bed_temp_max': 120,
+        'nozzle_diameter': 0.4, 'filament_diameter': 1.75,
+        'max_print_speed': 500, 'default_print_speed': 200,
+        'default_layer_height': 0.2,
+        'default_retraction_distance': 1.0, 'default_retraction_speed': 45,
+        'start_gcode': 'G28\nG29\nG92 E0',
+        'end_gcode': 'M104 S0\nM140 S0\nG28 X0\nM84',
+    },
+    'Bambu Lab P1P': {
+        'bed_size': [256, 256], 'bed_temp_max': 100,
+        'nozzle_diameter': 0.4, 'filament_diameter': 1.75,
+        'max_print_speed': 500, 'default_print_speed': 200,
+        'default_layer_height': 0.2,
+        'default_retraction_distance': 1.0, 'default_retraction_speed': 45,
+        'start_gcode': 'G28\nG92 E0',
+        'end_gcode': 'M104 S0\nM140 S0\nG28 X0\nM84',
+    },
+    'Prusa MK4': {
+        'bed_size': [250, 210], 'bed_temp_max': 110,
+        'nozzle_diameter': 0.4, 'filament_diameter': 1.75,
+        'max_print_speed': 300, 'default_print_speed': 60,
+        'default_layer_height': 0.2,
+        'default_retraction_distance': 2.0, 'default_retraction_speed': 45,
+        'start_gcode': 'G28\nG29\nG92 E0',
+        'end_gcode': 'M104 S0\nM140 S0\nG91\nG1 E-1 F300\nG1 Z1\nG90\nM84',
+    },
+    'Creality Ender-3': {
+        'bed_size': [220, 220], 'bed_temp_max': 110,
+        'nozzle_diameter': 0.4, 'filament_diameter': 1.75,
+        'max_print_speed': 150, 'default_print_speed': 50,
+        'default_layer_height': 0.2,
+        'default_retraction_distance': 5.0, 'default_retraction_speed': 45,
+        'start_gcode': 'G28\nG92 E0\nG1 Z2.0 F3000\nG1 X0.1 Y20 Z0.3 F5000\nG1 X0.1 Y150 E15 F1500\nG92 E0',
+        'end_gcode': 'G91\nG1 E-5 F300\nG1 Z10 F3000\nG90\nG28 X0\nM84\nM104 S0\nM140 S0',
+    },
+    'Easythreed K9': {
+        'bed_size': [100, 100], 'bed_temp_max': 0,
+        'nozzle_diameter': 0.4, 'filament_diameter': 1.75,
+        'max_print_speed': 40, 'default_print_speed': 30,
+        'default_layer_height': 0.3,
+        'default_retraction_distance': 6.5, 'default_retraction_speed': 25,
+        'start_gcode': 'T0\nM104 S{print_temp}\nM105\nM109 S{print_temp}\nM82\nG28\nG1 Z15.0 F6000\nG92 E0\nG1 F200 E3\nG92 E0\nG1 F1500 E-6.5',
+        'end_gcode': 'M104 S0\nM140 S0\nG28 X0 Y0\nM84\nM82\nM104 S0',
+    },
+    'Generic Printer': {
+        'bed_size': [220, 220], 'bed_temp_max': 100,
+        'nozzle_diameter': 0.4, 'filament_diameter': 1.75,
+        'max_print_speed': 300, 'default_print_speed': 60,
+        'default_layer_height': 0.2,
+        'default_retraction_distance': 5.0, 'default_retraction_speed': 45,
+        'start_gcode': 'G28\nG92 E0',
+        'end_gcode': 'M104 S0\nM140 S0\nM84',
+    },
+}
+
+
+# Full material list – used as fallback AND to recreate materials.json if missing.
+_DEFAULT_MATERIALS = {
+    'PLA':  {'print_temp': 210, 'bed_temp': 60,  'fan_speed': 100, 'retraction': 5.0},
+    'PETG': {'print_temp': 235, 'bed_temp': 80,  'fan_speed': 50,  'retraction': 6.0},
+    'ABS':  {'print_temp': 240, 'bed_temp': 100, 'fan_speed': 0,   'retraction': 5.0},
+    'TPU':  {'print_temp': 225, 'bed_temp': 60,  'fan_speed': 50,  'retraction': 1.0},
+    'ASA':  {'print_temp': 245, 'bed_temp': 100, 'fan_speed': 20,  'retraction': 5.0},
+}
+
+# Read-only views: a load fallback hands these out as the live profiles
+_DEFAULT_PRINTERS, _DEFAULT_MATERIALS = (
+    MappingProxyType({name: MappingProxyType(p) for name, p in d.items()})
+    for d in (_DEFAULT_PRINTERS, _DEFAULT_MATERIALS))
 
 
 # ---------------------------------------------------------------------------
 # Built-in presets
 # ---------------------------------------------------------------------------
+# Kept as a Python literal rather than JSON files so they load with the
+# module's bytecode; user presets are the only ones read from disk.
+
+# Shared chunks: temperature / fan / retraction defaults per material+printer
+_PLA_BASE = {
+    '_material': 'PLA',
+    'print_temp': 210, 'print_temp_first_layer': 215, 'bed_temp': 60,
+    'fan_speed': 100, 'fan_first_layer': 0, 'fan_kick_in_layer': 2,
+    'retraction_enabled': True, 'retraction_distance': 5.0,
+    'retraction_speed': 45, 'retraction_z_hop': 0.0,
+}
+_K9_BASE = {
+    '_printer': 'Easythreed K9', '_material': 'PLA',
+    'print_temp': 200, 'print_temp_first_layer': 205, 'bed_temp': 0,
+    'fan_speed': 100, 'fan_first_layer': 0, 'fan_kick_in_layer': 3,
+    'retraction_enabled': True, 'retraction_distance': 6.5,
+    'retraction_speed': 25, 'retraction_z_hop': 0.0,
+}
 
-_BUILTIN_PRESETS = {
+_BUILTIN_PRESETS = MappingProxyType({name: MappingProxyType(preset) for name, preset in {
     # ─── Generic ──────────────────────────────────────────────────────────
     "Draft (0.3mm, 10%, Fast)": {
+        **_PLA_BASE,
         'layer_height': 0.3, 'first_layer_height': 0.35,
         'wall_count': 2, 'infill_density': 10, 'infill_pattern': 'lines',
         'top_layers': 3, 'bottom_layers': 3,
         'outer_perimeter_speed': 60, 'print_speed': 80, 'infill_speed': 100,
         'top_bottom_speed': 60, 'first_layer_speed': 30, 'travel_speed': 200,
-        'print_temp': 210, 'print_temp_first_layer': 215, 'bed_temp': 60,
-        'fan_speed': 100, 'fan_first_layer': 0, 'fan_kick_in_layer': 2,
-        'retraction_enabled': True, 'retraction_distance': 5.0,
-        'retraction_speed': 45, 'retraction_z_hop': 0.0,
         'brim_enabled': False, 'support_enabled': False,
-        '_material': 'PLA',
     },
     "Normal Quality (0.2mm, 20%)": {
+        **_PLA_BASE,
         'layer_height': 0.2, 'first_layer_height': 0.3,
         'wall_count': 3, 'infill_density': 20, 'infill_pattern': 'grid',
         'top_layers': 4, 'bottom_layers': 4,
         'outer_perimeter_speed': 40, 'print_speed': 60, 'infill_speed': 80,
         'top_bottom_speed': 40, 'first_layer_speed': 25, 'travel_speed': 200,
-        'print_temp': 210, 'print_temp_first_layer': 215, 'bed_temp': 60,
-        'fan_speed': 100, 'fan_first_layer': 0, 'fan_kick_in_layer': 2,
-        'retraction_enabled': True, 'retraction_distance': 5.0,
-        'retraction_speed': 45, 'retraction_z_hop': 0.0,
         'brim_enabled': False, 'support_enabled': False,
-        '_material': 'PLA',
     },
     "High Quality (0.15mm, 30%)": {
+        **_PLA_BASE,
         'layer_height': 0.15, 'first_layer_height': 0.2,
         'wall_count': 4, 'infill_density': 30, 'infill_pattern': 'grid',
         'top_layers': 5, 'bottom_layers': 5,
         'outer_perimeter_speed': 25, 'print_speed': 40, 'infill_speed': 60,
         'top_bottom_speed': 30, 'first_layer_speed': 20, 'travel_speed': 150,
-        'print_temp': 205, 'print_temp_first_layer': 210, 'bed_temp': 60,
-        'fan_speed': 100, 'fan_first_layer': 0, 'fan_kick_in_layer': 3,
-        'retraction_enabled': True, 'retraction_distance': 5.0,
-        'retraction_speed': 45, 'retraction_z_hop': 0.05,
+        'print_temp': 205, 'print_temp_first_layer': 210,
+        'fan_kick_in_layer': 3, 'retraction_z_hop': 0.05,
         'brim_enabled': False, 'support_enabled': False,
-        '_material': 'PLA',
     },
     "Strong (0.2mm, 50%, Honeycomb)": {
+        **_PLA_BASE,
         'layer_height': 0.2, 'first_layer_height': 0.3,
         'wall_count': 4, 'infill_density': 50, 'infill_pattern': 'honeycomb',
         'top_layers': 5, 'bottom_layers': 5,
         'outer_perimeter_speed': 40, 'print_speed': 60, 'infill_speed': 80,
         'top_bottom_speed': 40, 'first_layer_speed': 25, 'travel_speed': 200,
-        'print_temp': 210, 'print_temp_first_layer': 215, 'bed_temp': 60,
-        'fan_speed': 100, 'fan_first_layer': 0, 'fan_kick_in_layer': 2,
-        'retraction_enabled': True, 'retraction_distance': 5.0,
-        'retraction_speed': 45, 'retraction_z_hop': 0.0,
         'brim_enabled': True, 'brim_width': 6.0, 'support_enabled': False,
-        '_material': 'PLA',
     },
     "With Support (Normal)": {
+        **_PLA_BASE,
         'layer_height': 0.2, 'first_layer_height': 0.3,
         'wall_count': 3, 'infill_density': 20, 'infill_pattern': 'grid',
         'top_layers': 4, 'bottom_layers': 4,
         'outer_perimeter_speed': 40, 'print_speed': 60, 'infill_speed': 80,
         'top_bottom_speed': 40, 'first_layer_speed': 25, 'travel_speed': 200,
-        'print_temp': 210, 'print_temp_first_layer': 215, 'bed_temp': 60,
-        'fan_speed': 100, 'fan_first_layer': 0, 'fan_kick_in_layer': 2,
-        'retraction_enabled': True, 'retraction_distance': 6.0,
-        'retraction_speed': 45, 'retraction_z_hop': 0.2,
+        'retraction_distance': 6.0, 'retraction_z_hop': 0.2,
         'brim_enabled': False,
         'support_enabled': True, 'support_threshold': 45.0,
         'support_density': 15, 'support_z_distance': 0.2, 'support_xy_distance': 0.7,
-        '_material': 'PLA',
     },
     # ─── Easythreed K9 ────────────────────────────────────────────────────
     "K9 – Draft (0.3mm, 10%)": {
-        '_printer': 'Easythreed K9', '_material': 'PLA',
+        **_K9_BASE,
         'layer_height': 0.3, 'first_layer_height': 0.3,
         'wall_count': 2, 'infill_density': 10, 'infill_pattern': 'lines',
         'top_layers': 3, 'bottom_layers': 3,
         'outer_perimeter_speed': 20, 'print_speed': 30, 'infill_speed': 35,
         'top_bottom_speed': 20, 'first_layer_speed': 15, 'travel_speed': 60,
-        'print_temp': 200, 'print_temp_first_layer': 205, 'bed_temp': 0,
-        'fan_speed': 100, 'fan_first_layer': 0, 'fan_kick_in_layer': 3,
-        'retraction_enabled': True, 'retraction_distance': 6.5,
-        'retraction_speed': 25, 'retraction_z_hop': 0.0,
         'brim_enabled': False, 'support_enabled': False,
     },
     "K9 – Normal (0.2mm, 20%)": {
-        '_printer': 'Easythreed K9', '_material': 'PLA',
+        **_K9_BASE,
         'layer_height': 0.2, 'first_layer_height': 0.25,
         'wall_count': 3, 'infill_density': 20, 'infill_pattern': 'grid',
         'top_layers': 4, 'bottom_layers': 4,
         'outer_perimeter_speed': 18, 'print_speed': 25, 'infill_speed': 30,
         'top_bottom_speed': 18, 'first_layer_speed': 12, 'travel_speed': 60,
-        'print_temp': 200, 'print_temp_first_layer': 205, 'bed_temp': 0,
-        'fan_speed': 100, 'fan_first_layer': 0, 'fan_kick_in_layer': 3,
-        'retraction_enabled': True, 'retraction_distance': 6.5,
-        'retraction_speed': 25, 'retraction_z_hop': 0.0,
         'brim_enabled': True, 'brim_width': 5.0, 'support_enabled': False,
     },
     "K9 – Quality (0.15mm, 30%)": {
-        '_printer': 'Easythreed K9', '_material': 'PLA',
+        **_K9_BASE,
         'layer_height': 0.15, 'first_layer_height': 0.2,
         'wall_count': 3, 'infill_density': 30, 'infill_pattern': 'grid',
         'top_layers': 5, 'bottom_layers': 5,
         'outer_perimeter_speed': 15, 'print_speed': 20, 'infill_speed': 25,
         'top_bottom_speed': 15, 'first_layer_speed': 10, 'travel_speed': 50,
-        'print_temp': 200, 'print_temp_first_layer': 205, 'bed_temp': 0,
-        'fan_speed': 100, 'fan_first_layer': 0, 'fan_kick_in_layer': 3,
-        'retraction_enabled': True, 'retraction_distance': 6.5,
-        'retraction_speed': 25, 'retraction_z_hop': 0.1,
+        'retraction_z_hop': 0.1,
         'brim_enabled': True, 'brim_width': 5.0, 'support_enabled': False,
     },
     # ─── PETG ─────────────────────────────────────────────────────────────
@@ -1520,4 +2014,9 @@ _BUILTIN_PRESETS = {
         'brim_enabled': False, 'support_enabled': False,
         '_material': 'PETG',
     },
-}
+}.items()})
+
+# Combo labels for the built-ins, formatted once at import
+_BUILTIN_PREFIX        = "[Built-in] "
+_BUILTIN_PREFIX_LEN    = len(_BUILTIN_PREFIX)
+_BUILTIN_DISPLAY_NAMES = tuple(_BUILTIN_PREFIX + name for name in _BUILTIN_PRESETS)
@@ -92,7 +92,7 @@ THEMES = {
     },
 }
 
-THEME_NAMES = list(THEMES.keys()) + ["Custom"]
+THEME_NAMES = tuple(THEMES) + ("Custom",)
 
 
 # ---------------------------------------------------------------------------
@@ -227,4 +227,45 @@ def _apply_stylesheet(app: QApplication, colors: dict):
             background: {c['highlight']};
             border-radius: 2px;
         }}
+
+        /* Settings panel group boxes – bold titles, slightly tighter inset */
+        SettingsPanel QGroupBox {{
+            font-weight: bold;
+        }}
+        SettingsPanel QGroupBox::title {{
+            left: 6px;
+        }}
+
+        /* Settings panel action buttons – fixed colors in every theme */
+        QPushButton#sliceBtn {{
+            background: #E87722;
+            color: white;
+            border-radius: 6px;
+        }}
+        QPushButton#sliceBtn:hover    {{ background: #FF8C32; }}
+        QPushButton#sliceBtn:pressed  {{ background: #C06010; }}
+        QPushButton#sliceBtn:disabled {{ background: #555; color: #888; }}
+        QPushButton#exportBtn {{
+            background: #2255AA;
+            color: white;
+            border-radius: 4px;
+        }}
+        QPushButton#exportBtn:hover    {{ background: #3366CC; }}
+        QPushButton#exportBtn:disabled {{ background: #333; color: #666; }}
+        QPushButton#gearBtn {{
+            background: #444;
+            border-radius: 3px;
+            font-size: 12px;
+        }}
+        QPushButton#gearBtn:hover {{ background: #3a7bd5; }}
+
+        /* Main window toolbar view-mode toggles */
+        QPushButton#viewBtn {{
+            padding: 2px 8px;
+        }}
+        QPushButton#viewBtn:checked {{
+            background: #3a7bd5;
+            color: white;
+            border-radius: 3px;
+        }}
     """)